@@ -26,12 +26,14 @@ from sdcpy_map.layers import (
     derive_compact_layers,
     detect_driver_events,
     resolve_driver_event_catalog,
+    save_layers_netcdf,
     save_layers_npz,
 )
 from sdcpy_map.plotting import (
     plot_correlation_maps_by_lag,
     plot_layer_maps_compact,
     plot_single_layer_map,
+    update_layer_maps_compact,
 )
 
 __all__ = [
@@ -56,7 +58,9 @@ __all__ = [
     "compute_sdcmap_layers",
     "derive_compact_layers",
     "save_layers_npz",
+    "save_layers_netcdf",
     "plot_correlation_maps_by_lag",
     "plot_layer_maps_compact",
     "plot_single_layer_map",
+    "update_layer_maps_compact",
 ]
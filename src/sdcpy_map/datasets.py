@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import importlib.util
+import json
 import subprocess
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.request import Request, urlopen, urlretrieve
 
-import geopandas as gpd
 import numpy as np
 import pandas as pd
 import xarray as xr
 
 from sdcpy_map.config import SDCMapConfig
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+# Columnar Arrow readers are used when the optional ``pyarrow`` package is installed.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 
 @dataclass(frozen=True)
 class DriverDatasetSpec:
@@ -86,6 +98,45 @@ FIELD_DATASETS: dict[str, FieldDatasetSpec] = {
 DEFAULT_DRIVER_DATASET_KEY = "pdo"
 DEFAULT_FIELD_DATASET_KEY = "ncep_air"
 
+# Sidecar file (next to downloaded datasets) remembering recent remote size checks.
+REMOTE_CHECK_CACHE_NAME = ".cache.json"
+_REMOTE_CHECK_CACHE_LOCK = threading.Lock()
+
+
+def _read_remote_check_cache(cache_path: Path) -> dict[str, dict[str, object]]:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _remote_content_length(url: str, cache_path: Path, max_age: float) -> int | None:
+    """Return the remote Content-Length, reusing a cached HEAD result younger than ``max_age``."""
+    with _REMOTE_CHECK_CACHE_LOCK:
+        entry = _read_remote_check_cache(cache_path).get(url)
+    if isinstance(entry, dict) and time.time() - float(entry.get("checked_at", 0.0)) < max_age:
+        cached_size = entry.get("content_length")
+        return int(cached_size) if cached_size is not None else None
+
+    try:
+        request = Request(url, method="HEAD")
+        with urlopen(request, timeout=20) as response:
+            remote_size_raw = response.headers.get("Content-Length")
+        remote_size = int(remote_size_raw) if remote_size_raw is not None else None
+    except Exception:
+        # Failed checks are not cached so the next run retries.
+        return None
+
+    with _REMOTE_CHECK_CACHE_LOCK:
+        cache = _read_remote_check_cache(cache_path)
+        cache[url] = {"content_length": remote_size, "checked_at": time.time()}
+        try:
+            cache_path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+        except OSError:
+            pass
+    return remote_size
+
 
 def download_if_missing(
     url: str,
@@ -94,8 +145,14 @@ def download_if_missing(
     refresh: bool = False,
     verify_remote: bool = False,
     offline: bool = False,
+    remote_check_max_age: float = 86400.0,
 ) -> Path:
-    """Download a dataset with cache-first behavior and optional revalidation."""
+    """Download a dataset with cache-first behavior and optional revalidation.
+
+    With ``verify_remote=True`` the remote size is checked with a HEAD request. Results
+    are remembered in a ``.cache.json`` sidecar next to ``destination`` and reused for
+    ``remote_check_max_age`` seconds; pass ``0`` to always re-check.
+    """
     destination.parent.mkdir(parents=True, exist_ok=True)
 
     def _is_non_empty(path: Path) -> bool:
@@ -111,13 +168,11 @@ def download_if_missing(
         if offline or not verify_remote:
             return destination
 
-        try:
-            request = Request(url, method="HEAD")
-            with urlopen(request, timeout=20) as response:
-                remote_size_raw = response.headers.get("Content-Length")
-            remote_size = int(remote_size_raw) if remote_size_raw is not None else None
-        except Exception:
-            remote_size = None
+        remote_size = _remote_content_length(
+            url,
+            destination.parent / REMOTE_CHECK_CACHE_NAME,
+            float(remote_check_max_age),
+        )
 
         # Only redownload when the remote size is known and local is clearly stale.
         if remote_size is None or destination.stat().st_size >= remote_size:
@@ -188,54 +243,88 @@ def fetch_public_example_data(
         raise ValueError(f"Unknown field dataset '{field_key}'. Supported: {supported}.")
 
     data_dir = Path(data_dir)
-    out: dict[str, Path] = {}
-
-    driver_spec = DRIVER_DATASETS[driver_key]
-    field_spec = FIELD_DATASETS[field_key]
-    out["driver"] = download_if_missing(driver_spec.url, data_dir / Path(driver_spec.url).name)
-    out["field"] = download_if_missing(field_spec.url, data_dir / Path(field_spec.url).name)
-
+    sources = {
+        "driver": DRIVER_DATASETS[driver_key].url,
+        "field": FIELD_DATASETS[field_key].url,
+    }
     if include_coastline:
-        out["coastline"] = download_if_missing(COASTLINE_URL, data_dir / Path(COASTLINE_URL).name)
+        sources["coastline"] = COASTLINE_URL
 
-    return out
+    # Downloads are independent and network-bound, so overlap them.
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {
+            key: executor.submit(download_if_missing, url, data_dir / Path(url).name)
+            for key, url in sources.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
 
 
 def _parse_psl_table_driver(path: Path | str) -> pd.Series:
     """Parse NOAA PSL monthly climate-index table format."""
-    rows: list[tuple[pd.Timestamp, float]] = []
     with open(path, encoding="utf-8") as handle:
-        for line in handle:
-            parts = line.strip().split()
-            if len(parts) < 13:
-                continue
-            year_token = parts[0]
-            if not year_token.lstrip("-").isdigit():
-                continue
-
-            year = int(year_token)
-            for month_idx, raw in enumerate(parts[1:13], start=1):
-                value = float(raw)
-                # Missing-value codes used by PSL index tables.
-                if np.isclose(value, -9.90) or np.isclose(value, -99.90):
-                    continue
-                rows.append((pd.Timestamp(year=year, month=month_idx, day=1), value))
-
-    if not rows:
+        lines = handle.read().splitlines()
+
+    # Year rows carry a year token and twelve monthly values; the header, trailer and
+    # any notes are skipped, whatever year range the header line declares.
+    row_numbers = [
+        number
+        for number, line in enumerate(lines)
+        if len(parts := line.split()) >= 13 and parts[0].lstrip("-").isdigit()
+    ]
+    if not row_numbers:
         raise ValueError(f"No valid monthly rows were found in '{path}'.")
+    rows = [lines[number] for number in row_numbers]
 
-    driver = pd.Series(
-        [value for _, value in rows],
-        index=pd.DatetimeIndex([date for date, _ in rows]),
+    # The trailer opens with a line holding just the table's missing-value code.
+    missing_codes = [-9.90, -99.90]
+    trailer = lines[row_numbers[-1] + 1].split() if row_numbers[-1] + 1 < len(lines) else []
+    if len(trailer) == 1:
+        try:
+            missing_codes.append(float(trailer[0]))
+        except ValueError:
+            pass
+    try:
+        table = np.loadtxt(rows, usecols=range(13), ndmin=2)
+    except ValueError as exc:
+        raise ValueError(f"No valid monthly rows were found in '{path}'.") from exc
+
+    years = table[:, 0].astype(int)
+    values = table[:, 1:].ravel()
+    # Missing-value codes used by PSL index tables; they parse to these exact doubles.
+    missing = np.isin(values, missing_codes)
+    if np.all(missing):
+        raise ValueError(f"No valid monthly rows were found in '{path}'.")
+
+    dates = pd.to_datetime(
+        pd.DataFrame(
+            {
+                "year": np.repeat(years, 12),
+                "month": np.tile(np.arange(1, 13), len(years)),
+                "day": 1,
+            }
+        )
+    )
+    return pd.Series(
+        values[~missing],
+        index=pd.DatetimeIndex(dates[~missing]),
         name="driver",
     ).sort_index()
-    return driver
 
 
 def _parse_nino34_csv_driver(path: Path | str) -> pd.Series:
     """Parse NOAA PSL Niño3.4 CSV format."""
-    raw = pd.read_csv(path)
-    raw.columns = ["date", "value"]
+    # The file's own header is skipped rather than replaced, since the pyarrow engine
+    # ignores ``names`` alongside ``header=0`` on pandas 2. Dates are read as text so both
+    # engines hand ``pd.to_datetime`` the same input and the index resolution does not
+    # depend on which engine is installed.
+    raw = pd.read_csv(
+        path,
+        engine="pyarrow" if _HAS_PYARROW else "c",
+        header=None,
+        skiprows=1,
+        names=["date", "value"],
+        dtype={"date": str},
+    )
     raw["date"] = pd.to_datetime(raw["date"])
     return (
         raw.loc[raw["value"] > -9990]
@@ -285,33 +374,51 @@ def load_field_anomaly_subset(
         raise ValueError(f"Unknown field dataset '{field_key}'. Supported: {supported}.")
 
     spec = FIELD_DATASETS[field_key]
-    ds = xr.open_dataset(field_path)
-    if spec.variable not in ds.data_vars:
-        available = ", ".join(ds.data_vars)
-        raise ValueError(
-            f"Variable '{spec.variable}' not found in '{field_path}'. Available: {available}."
-        )
-    field = ds[spec.variable]
-
-    if spec.wrap_longitude and "lon" in field.coords:
-        field = field.assign_coords(lon=(((field.lon + 180) % 360) - 180)).sortby("lon")
-
-    subset = field.sel(
-        time=slice(config.time_start, config.time_end),
-        lat=_slice_for_lat(field["lat"], config.lat_min, config.lat_max),
-        lon=slice(config.lon_min, config.lon_max),
-    )
-
-    subset_anom = subset.groupby("time.month") - subset.groupby("time.month").mean("time")
-    return subset_anom.isel(
-        lat=slice(None, None, config.lat_stride),
-        lon=slice(None, None, config.lon_stride),
-    )
+    # The backend array stays lazy until ``.load()``, so only the selected hyperslab is read.
+    with xr.open_dataset(field_path) as ds:
+        if spec.variable not in ds.data_vars:
+            available = ", ".join(ds.data_vars)
+            raise ValueError(
+                f"Variable '{spec.variable}' not found in '{field_path}'. Available: {available}."
+            )
+        field = ds[spec.variable]
+
+        if spec.wrap_longitude and "lon" in field.coords:
+            field = field.assign_coords(lon=(((field.lon + 180) % 360) - 180)).sortby("lon")
+
+        subset = field.sel(
+            time=slice(config.time_start, config.time_end),
+            lat=_slice_for_lat(field["lat"], config.lat_min, config.lat_max),
+            lon=slice(config.lon_min, config.lon_max),
+        ).isel(
+            lat=slice(None, None, config.lat_stride),
+            lon=slice(None, None, config.lon_stride),
+        ).load()
+
+    # Anomalies are per cell, so striding first is equivalent and avoids dropped cells.
+    return _monthly_anomalies(subset)
+
+
+def _monthly_anomalies(field: xr.DataArray) -> xr.DataArray:
+    """Subtract each calendar month's climatology in a single pass over the cube."""
+    months = field["time"].dt.month.values
+    # Copy into a floating dtype so integer fields can hold fractional anomalies.
+    values = field.values.astype(np.result_type(field.dtype, np.float32))
+    with warnings.catch_warnings():
+        # All-NaN cells (land) have no climatology and stay NaN.
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        for month in np.unique(months):
+            rows = months == month
+            values[rows] -= np.nanmean(values[rows], axis=0)
+    return field.copy(data=values).assign_coords(month=("time", months))
 
 
 def load_coastline(coastline_zip: Path | str) -> gpd.GeoDataFrame:
     """Load Natural Earth coastline geometry."""
-    return gpd.read_file(coastline_zip)
+    # Imported here so that importing the package does not pay for geopandas.
+    import geopandas as gpd
+
+    return gpd.read_file(coastline_zip, engine="pyogrio", use_arrow=_HAS_PYARROW)
 
 
 def _sample_timestamps(idx: pd.DatetimeIndex, limit: int = 3) -> str:
@@ -354,7 +461,7 @@ def _align_driver_to_field_periods(
 
 def align_driver_to_field(driver: pd.Series, mapped_field: xr.DataArray) -> pd.Series:
     """Align a driver time series to mapped-field timestamps."""
-    idx = pd.DatetimeIndex(mapped_field.time.values)
+    idx = pd.DatetimeIndex(mapped_field.get_index("time"))
     aligned = driver.reindex(idx)
     if not aligned.isna().any():
         return aligned
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
+import warnings
 from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable
 
@@ -29,9 +32,27 @@ LAG_MAP_KEYS = (
     "event_count_by_lag",
 )
 
+MIN_BLOCK_CELLS = 256
+
+# Correlations closer than this are treated as ties, both in permutation tests and when
+# ranking candidates. Batched products can differ by a few ULPs depending on block shape.
+CORRELATION_TIE_TOLERANCE = 1e-12
+
+# ``(center_idx, start, lag_slice, driver_terms)`` for one admissible driver window.
+_DriverWindow = tuple[int, int, slice, tuple[np.ndarray, ...]]
+
+
+def _empty_layer_stack(*shape: int) -> np.ndarray:
+    return np.full((len(LAYER_KEYS), *shape), np.nan, dtype=float)
+
+
+def _layer_views(stack: np.ndarray) -> dict[str, np.ndarray]:
+    """Name the rows of a ``(metric, ...)`` layer stack without copying them."""
+    return {key: stack[idx] for idx, key in enumerate(LAYER_KEYS)}
+
 
 def _empty_layers(nlat: int, nlon: int) -> dict[str, np.ndarray]:
-    return {key: np.full((nlat, nlon), np.nan, dtype=float) for key in LAYER_KEYS}
+    return _layer_views(_empty_layer_stack(nlat, nlon))
 
 
 def _serialize_event(event: dict[str, object]) -> dict[str, object]:
@@ -373,270 +394,320 @@ def detect_driver_events(driver: pd.Series, config: SDCMapConfig) -> dict[str, o
 
 
 def _center_rows(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-    centered = values - np.mean(values, axis=1, keepdims=True)
-    norms = np.linalg.norm(centered, axis=1)
+    centered = values - np.mean(values, axis=-1, keepdims=True)
+    norms = np.linalg.norm(centered, axis=-1)
     return centered, norms
 
 
-def _correlate_reference_against_rows(reference: np.ndarray, rows: np.ndarray) -> np.ndarray:
-    reference_matrix = np.asarray(reference, dtype=float).reshape(1, -1)
-    row_matrix = np.asarray(rows, dtype=float)
-    ref_centered, ref_norms = _center_rows(reference_matrix)
-    row_centered, row_norms = _center_rows(row_matrix)
-    denom = ref_norms[0] * row_norms
-    with np.errstate(divide="ignore", invalid="ignore"):
-        corr = (row_centered @ ref_centered[0]) / denom
-    corr[~np.isfinite(denom) | (denom == 0)] = np.nan
-    return corr
+def _event_driver_windows(
+    driver_vals: np.ndarray,
+    *,
+    event_idx: int,
+    width: int,
+    n_permutations: int,
+    lag_values: np.ndarray,
+) -> list[_DriverWindow]:
+    """Precompute the driver side of every admissible window around one event.
+
+    Each window carries the contiguous run of ``lag_values`` whose field window fits
+    the series, plus ``terms``: the centered driver segment, its norm, and the centered
+    permutations with their norms. These only depend on the driver, the lag range and
+    the series length, so they are computed once and shared by all cells.
+    """
+    ntime = len(driver_vals)
+    windows: list[_DriverWindow] = []
+    for center_idx in _iter_event_centers(int(event_idx), width, ntime):
+        bounds = _event_window_bounds(center_idx, width, ntime)
+        if bounds is None:
+            continue
+        start, stop = bounds
+        starts_2 = start - lag_values
+        lag_positions = np.flatnonzero((starts_2 >= 0) & (starts_2 + width <= ntime))
+        if not len(lag_positions):
+            continue
+        driver_segment = np.asarray(driver_vals[start:stop], dtype=float)
+        if np.isnan(driver_segment).any() or np.nanstd(driver_segment) == 0:
+            continue
+        lag_slice = slice(int(lag_positions[0]), int(lag_positions[-1]) + 1)
+        # Permutations depend only on the event window, so every cell shares them.
+        rng = np.random.default_rng((0, int(event_idx), int(center_idx)))
+        permutations = rng.permuted(np.tile(driver_segment, (int(n_permutations), 1)), axis=1)
+        terms = (*_center_rows(driver_segment), *_center_rows(permutations))
+        windows.append((center_idx, start, lag_slice, terms))
+    return windows
 
 
-def _correlation_matrix(left_rows: np.ndarray, right_rows: np.ndarray) -> np.ndarray:
-    left_centered, left_norms = _center_rows(np.asarray(left_rows, dtype=float))
-    right_centered, right_norms = _center_rows(np.asarray(right_rows, dtype=float))
-    denom = np.outer(left_norms, right_norms)
+def _driver_event_windows(
+    driver_vals: np.ndarray,
+    config: SDCMapConfig,
+    event_catalog: dict[str, object],
+    lag_values: np.ndarray,
+) -> dict[str, list[tuple[int, list[_DriverWindow]]]]:
+    """Precompute driver windows for the selected events of both sign classes."""
+    return {
+        sign_key: [
+            (
+                int(event_idx),
+                _event_driver_windows(
+                    driver_vals,
+                    event_idx=int(event_idx),
+                    width=int(config.correlation_width),
+                    n_permutations=int(config.n_permutations),
+                    lag_values=lag_values,
+                ),
+            )
+            for event_idx in event_catalog[indices_key]
+        ]
+        for sign_key, indices_key in (
+            ("positive", "selected_positive_indices"),
+            ("negative", "selected_negative_indices"),
+        )
+    }
+
+
+def _lagged_window_correlations(
+    driver_terms: tuple[np.ndarray, ...],
+    field_centered: np.ndarray,
+    field_norms: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Correlate one precomputed driver window (and its permutations) against many field windows.
+
+    ``field_centered`` holds centered field windows with shape ``(lag, cell, width)``
+    and ``field_norms`` their norms; the observed correlations have shape
+    ``(lag, cell)`` and the permutation correlations ``(lag, cell, perm)``.
+    """
+    driver_centered, driver_norm, perm_centered, perm_norms = driver_terms
+
+    denom = field_norms * driver_norm
+    perm_denom = field_norms[..., None] * perm_norms
     with np.errstate(divide="ignore", invalid="ignore"):
-        corr = (left_centered @ right_centered.T) / denom
-    corr[~np.isfinite(denom) | (denom == 0)] = np.nan
-    return corr
+        observed = (field_centered @ driver_centered) / denom
+        perm_corr = (field_centered @ perm_centered.T) / perm_denom
+    observed[~np.isfinite(denom) | (denom == 0)] = np.nan
+    perm_corr[~np.isfinite(perm_denom) | (perm_denom == 0)] = np.nan
+    return observed, perm_corr
 
 
 def _permutation_p_values(
-    driver_segment: np.ndarray,
-    field_segments: np.ndarray,
     observed: np.ndarray,
+    perm_corr: np.ndarray,
     *,
-    n_permutations: int,
     two_tailed: bool,
-    rng: np.random.Generator,
 ) -> np.ndarray:
+    """Permutation p-values; ``perm_corr`` carries the permutations on its last axis."""
+    n_permutations = int(perm_corr.shape[-1])
     if n_permutations < 1:
         return np.full_like(observed, np.nan, dtype=float)
 
-    permutations = np.vstack([rng.permutation(driver_segment) for _ in range(n_permutations)])
-    perm_corr = _correlation_matrix(permutations, field_segments)
-
     observed_vals = np.asarray(observed, dtype=float)
-    counts = np.zeros_like(observed_vals, dtype=float)
     finite_mask = np.isfinite(observed_vals)
-    if two_tailed:
-        counts[finite_mask] = np.sum(
-            np.abs(perm_corr[:, finite_mask]) >= np.abs(observed_vals[finite_mask])[None, :],
-            axis=0,
-        )
-    else:
-        positive_mask = finite_mask & (observed_vals >= 0)
-        negative_mask = finite_mask & (observed_vals < 0)
-        if np.any(positive_mask):
-            counts[positive_mask] = np.sum(
-                perm_corr[:, positive_mask] >= observed_vals[positive_mask][None, :],
-                axis=0,
-            )
-        if np.any(negative_mask):
-            counts[negative_mask] = np.sum(
-                perm_corr[:, negative_mask] <= observed_vals[negative_mask][None, :],
-                axis=0,
-            )
+    reference = observed_vals[..., None]
+    tol = CORRELATION_TIE_TOLERANCE
+    with np.errstate(invalid="ignore"):
+        if two_tailed:
+            exceed = np.abs(perm_corr) >= np.abs(reference) - tol
+        else:
+            exceed = np.where(reference >= 0, perm_corr >= reference - tol, perm_corr <= reference + tol)
+    counts = np.sum(exceed, axis=-1).astype(float)
     p_values = (counts + 1.0) / float(n_permutations + 1)
     p_values[~finite_mask] = np.nan
     return p_values
 
 
-def _candidate_score(
-    corr_value: float,
-    lag_value: float,
-    driver_rel_time: float,
-) -> tuple[float, float, float, float, float]:
-    """Order candidates by strength, then by simpler timing."""
-    return (
-        -abs(float(corr_value)),
-        abs(float(lag_value)),
-        abs(float(driver_rel_time)),
-        float(lag_value),
-        float(driver_rel_time),
-    )
-
-
-def _aggregate_event_summaries(items: list[dict[str, float]]) -> dict[str, float] | None:
-    if not items:
-        return None
-    keys = items[0].keys()
-    out = {key: float(np.mean([item[key] for item in items])) for key in keys}
-    out["n_selected"] = float(len(items))
-    out["dominant_sign"] = 1.0 if out["corr_mean"] >= 0 else -1.0
-    return out
-
-
-def _summarize_event_window(
-    driver_vals: np.ndarray,
-    local_vals: np.ndarray,
+def _is_better_candidate(
+    candidate: tuple[np.ndarray | float, ...],
+    incumbent: tuple[np.ndarray, ...],
+) -> np.ndarray:
+    """Elementwise lexicographic ``candidate < incumbent`` over candidate scores.
+
+    Scores are ``(-|corr|, |lag|, |driver_rel_time|, lag, driver_rel_time)``, which
+    orders candidates by strength, then by simpler timing.
+    """
+    tol = CORRELATION_TIE_TOLERANCE
+    better = np.zeros(np.shape(incumbent[0]), dtype=bool)
+    undecided = np.ones_like(better)
+    with np.errstate(invalid="ignore"):
+        for cand, inc in zip(candidate, incumbent):
+            better |= undecided & (cand < inc - tol)
+            undecided &= np.abs(cand - inc) <= tol
+    return better
+
+
+def _update_best(
+    best: tuple[np.ndarray, ...],
+    candidate: tuple[np.ndarray | float, ...],
+    mask: np.ndarray,
+) -> None:
+    for best_component, cand_component in zip(best, candidate):
+        best_component[mask] = np.broadcast_to(cand_component, mask.shape)[mask]
+
+
+def _summarize_event_block(
+    block_values: np.ndarray,
     *,
     event_idx: int,
+    windows: list[_DriverWindow],
     config: SDCMapConfig,
-    rng: np.random.Generator,
-) -> dict[str, float] | None:
-    best_summary: dict[str, float] | None = None
-    best_score: tuple[float, float, float, float, float] | None = None
-
-    for center_idx in _iter_event_centers(int(event_idx), int(config.correlation_width), len(driver_vals)):
-        bounds = _event_window_bounds(center_idx, int(config.correlation_width), len(driver_vals))
-        if bounds is None:
-            continue
-        start_1, stop_1 = bounds
-        driver_segment = np.asarray(driver_vals[start_1:stop_1], dtype=float)
-        if np.isnan(driver_segment).any() or np.nanstd(driver_segment) == 0:
-            continue
+    lag_values: np.ndarray,
+) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """Find the strongest significant response to one event for every cell in a block.
+
+    Returns per-cell event summaries (NaN where nothing is significant) and the best
+    significant correlation per lag with shape ``(lag, cell)``.
+    """
+    width = int(config.correlation_width)
+    ncell = block_values.shape[1]
+    nlag = len(lag_values)
+
+    summary = {
+        key: np.full(ncell, np.nan, dtype=float)
+        for key in ("corr_mean", "driver_rel_time_mean", "lag_mean", "strong_start")
+    }
+    best_score = tuple(np.full(ncell, np.inf, dtype=float) for _ in range(5))
+    lag_corr = np.full((nlag, ncell), np.nan, dtype=float)
+    lag_best_score = tuple(np.full((nlag, ncell), np.inf, dtype=float) for _ in range(5))
+
+    if not windows:
+        return summary, lag_corr
+    # Lag slices are precomputed per window, so these bounds need no clipping.
+    first = min(start - int(lag_values[lag_slice.stop - 1]) for _, start, lag_slice, _ in windows)
+    last = max(start - int(lag_values[lag_slice.start]) for _, start, lag_slice, _ in windows)
+    # Neighbouring driver windows and lags revisit the same field windows, so every
+    # field window the event can touch is centered once up front.
+    field_centered, field_norms = _center_rows(
+        np.lib.stride_tricks.sliding_window_view(block_values[first : last + width], width, axis=0)
+    )
 
-        lag_values: list[int] = []
-        field_segments: list[np.ndarray] = []
-        for lag in range(int(config.min_lag), int(config.max_lag) + 1):
-            start_2 = start_1 - int(lag)
-            stop_2 = start_2 + int(config.correlation_width)
-            if start_2 < 0 or stop_2 > len(local_vals):
-                continue
-            field_segment = np.asarray(local_vals[start_2:stop_2], dtype=float)
-            if np.isnan(field_segment).any() or np.nanstd(field_segment) == 0:
-                continue
-            lag_values.append(int(lag))
-            field_segments.append(field_segment)
-        if not field_segments:
-            continue
+    for center_idx, start_1, lag_slice, driver_terms in windows:
+        # Valid lags form one contiguous run, so lag-indexed state is updated through views.
+        window_lags = lag_values[lag_slice].astype(float)
+        rows = start_1 - lag_values[lag_slice] - first
 
-        field_matrix = np.asarray(field_segments, dtype=float)
-        observed = _correlate_reference_against_rows(driver_segment, field_matrix)
-        p_values = _permutation_p_values(
-            driver_segment,
-            field_matrix,
-            observed,
-            n_permutations=int(config.n_permutations),
-            two_tailed=bool(config.two_tailed),
-            rng=rng,
-        )
+        observed, perm_corr = _lagged_window_correlations(driver_terms, field_centered[rows], field_norms[rows])
+        p_values = _permutation_p_values(observed, perm_corr, two_tailed=bool(config.two_tailed))
         significant = np.isfinite(observed) & np.isfinite(p_values) & (p_values <= float(config.alpha))
         if not np.any(significant):
             continue
 
         driver_rel_center = float(int(center_idx) - int(event_idx))
-        for idx in np.flatnonzero(significant):
-            corr_value = float(observed[idx])
-            lag_value = float(lag_values[idx])
-            score = _candidate_score(corr_value, lag_value, driver_rel_center)
-            if best_score is not None and score >= best_score:
-                continue
-            best_score = score
-            best_summary = {
-                "corr_mean": corr_value,
-                "driver_rel_time_mean": driver_rel_center,
-                "lag_mean": lag_value,
-                "timing_combo": driver_rel_center - lag_value,
-                "strong_span": float(int(config.correlation_width) - 1),
-                "strong_start": float(start_1 - int(event_idx)),
-                "dominant_sign": 1.0 if corr_value >= 0 else -1.0,
-                "n_selected": 1.0,
-            }
-
-    return best_summary
-
-
-def _compute_event_lag_correlations(
-    driver_vals: np.ndarray,
-    local_vals: np.ndarray,
+        abs_observed = np.abs(observed)
+        lag_scores = (
+            -abs_observed,
+            np.abs(window_lags)[:, None],
+            abs(driver_rel_center),
+            window_lags[:, None],
+            driver_rel_center,
+        )
+        lag_best = tuple(component[lag_slice] for component in lag_best_score)
+        lag_update = significant & _is_better_candidate(lag_scores, lag_best)
+        _update_best(lag_best, lag_scores, lag_update)
+        lag_corr[lag_slice][lag_update] = observed[lag_update]
+
+        # Within one window the timing terms only vary with lag: take the strongest
+        # significant correlation, then the smallest |lag|, then the negative lag.
+        ranked_strength = np.where(significant, abs_observed, -np.inf)
+        strongest = np.max(ranked_strength, axis=0)
+        tied = significant & (ranked_strength >= strongest - CORRELATION_TIE_TOLERANCE)
+        lag_order = 2.0 * np.abs(window_lags) + (window_lags > 0)
+        best_rows = np.argmin(np.where(tied, lag_order[:, None], np.inf), axis=0)
+        cells = np.arange(ncell)
+        best_corr = observed[best_rows, cells]
+        best_lag = window_lags[best_rows]
+        score = (-np.abs(best_corr), np.abs(best_lag), abs(driver_rel_center), best_lag, driver_rel_center)
+        update = np.any(significant, axis=0) & _is_better_candidate(score, best_score)
+        _update_best(best_score, score, update)
+        summary["corr_mean"][update] = best_corr[update]
+        summary["driver_rel_time_mean"][update] = driver_rel_center
+        summary["lag_mean"][update] = best_lag[update]
+        summary["strong_start"][update] = float(start_1 - int(event_idx))
+
+    return summary, lag_corr
+
+
+def _summarize_class_block(
+    block_values: np.ndarray,
     *,
-    event_idx: int,
+    event_windows: list[tuple[int, list[_DriverWindow]]],
     config: SDCMapConfig,
-    lag_values: list[int],
-    rng: np.random.Generator,
-) -> np.ndarray:
-    """Compute significant event-local correlations for every requested lag."""
-    out = np.full(len(lag_values), np.nan, dtype=float)
-    best_scores: list[tuple[float, float, float, float, float] | None] = [None] * len(lag_values)
-
-    for center_idx in _iter_event_centers(int(event_idx), int(config.correlation_width), len(driver_vals)):
-        bounds = _event_window_bounds(center_idx, int(config.correlation_width), len(driver_vals))
-        if bounds is None:
-            continue
-        start_1, stop_1 = bounds
-        driver_segment = np.asarray(driver_vals[start_1:stop_1], dtype=float)
-        if np.isnan(driver_segment).any() or np.nanstd(driver_segment) == 0:
-            continue
-
-        field_segments: list[np.ndarray] = []
-        valid_positions: list[int] = []
-        for idx, lag in enumerate(lag_values):
-            start_2 = start_1 - int(lag)
-            stop_2 = start_2 + int(config.correlation_width)
-            if start_2 < 0 or stop_2 > len(local_vals):
-                continue
-            field_segment = np.asarray(local_vals[start_2:stop_2], dtype=float)
-            if np.isnan(field_segment).any() or np.nanstd(field_segment) == 0:
-                continue
-            valid_positions.append(idx)
-            field_segments.append(field_segment)
-
-        if not field_segments:
-            continue
-
-        field_matrix = np.asarray(field_segments, dtype=float)
-        observed = _correlate_reference_against_rows(driver_segment, field_matrix)
-        p_values = _permutation_p_values(
-            driver_segment,
-            field_matrix,
-            observed,
-            n_permutations=int(config.n_permutations),
-            two_tailed=bool(config.two_tailed),
-            rng=rng,
+    lag_values: np.ndarray,
+) -> dict[str, object]:
+    """Average event-level responses of one sign class over a block of cells.
+
+    Layers come back as one ``(metric, cell)`` stack ordered like ``LAYER_KEYS``.
+    """
+    ncell = block_values.shape[1]
+    layer_stack = _empty_layer_stack(ncell)
+    layers = _layer_views(layer_stack)
+    corr_by_lag = np.full((len(lag_values), ncell), np.nan, dtype=float)
+    event_count_by_lag = np.zeros((len(lag_values), ncell), dtype=float)
+    if not event_windows:
+        return {"layers": layer_stack, "corr_by_lag": corr_by_lag, "event_count_by_lag": event_count_by_lag}
+
+    event_summaries: list[dict[str, np.ndarray]] = []
+    event_lag_corr: list[np.ndarray] = []
+    for event_idx, windows in event_windows:
+        summary, lag_corr = _summarize_event_block(
+            block_values,
+            event_idx=event_idx,
+            windows=windows,
+            config=config,
+            lag_values=lag_values,
         )
-        significant = np.isfinite(observed) & np.isfinite(p_values) & (p_values <= float(config.alpha))
-        if not np.any(significant):
-            continue
+        summary["timing_combo"] = summary["driver_rel_time_mean"] - summary["lag_mean"]
+        event_summaries.append(summary)
+        event_lag_corr.append(lag_corr)
+
+    event_corr = np.vstack([summary["corr_mean"] for summary in event_summaries])
+    retained = np.isfinite(event_corr)
+    n_retained = np.sum(retained, axis=0).astype(float)
+    has_any = n_retained > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for key in ("corr_mean", "driver_rel_time_mean", "lag_mean", "timing_combo", "strong_start"):
+            stacked = np.vstack([summary[key] for summary in event_summaries])
+            layers[key][:] = np.where(has_any, np.where(retained, stacked, 0.0).sum(axis=0) / n_retained, np.nan)
+    layers["strong_span"][:] = np.where(has_any, float(int(config.correlation_width) - 1), np.nan)
+    layers["dominant_sign"][:] = np.where(has_any, np.where(layers["corr_mean"] >= 0, 1.0, -1.0), np.nan)
+    layers["n_selected"][:] = np.where(has_any, n_retained, np.nan)
+
+    lag_stack = np.asarray(event_lag_corr, dtype=float)
+    finite_mask = np.isfinite(lag_stack)
+    event_count_by_lag = np.sum(finite_mask, axis=0).astype(float)
+    sums = np.where(finite_mask, lag_stack, 0.0).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr_by_lag = np.where(event_count_by_lag > 0, sums / event_count_by_lag, np.nan)
+    return {"layers": layer_stack, "corr_by_lag": corr_by_lag, "event_count_by_lag": event_count_by_lag}
 
-        driver_rel_center = float(int(center_idx) - int(event_idx))
-        for local_idx, is_significant in enumerate(significant):
-            if not is_significant:
-                continue
-            lag_position = int(valid_positions[local_idx])
-            corr_value = float(observed[local_idx])
-            lag_value = float(lag_values[lag_position])
-            score = _candidate_score(corr_value, lag_value, driver_rel_center)
-            if best_scores[lag_position] is not None and score >= best_scores[lag_position]:
-                continue
-            best_scores[lag_position] = score
-            out[lag_position] = corr_value
-    return out
 
+def _valid_cell_mask(panel: np.ndarray, driver_vals: np.ndarray, width: int) -> np.ndarray:
+    """Flag cells of a ``(time, cell)`` panel with a complete, non-constant series."""
+    if np.isnan(driver_vals).any() or panel.shape[0] < int(width) + 3:
+        return np.zeros(panel.shape[1], dtype=bool)
+    valid = np.all(np.isfinite(panel), axis=0)
+    with np.errstate(invalid="ignore"):
+        valid &= np.std(panel, axis=0) > 0
+    return valid
 
-def _summarize_gridpoint_by_class(
-    driver_vals: np.ndarray,
-    local_vals: np.ndarray,
+
+def _summarize_cell_block(
+    block_values: np.ndarray,
+    event_windows: dict[str, list[tuple[int, list[_DriverWindow]]]],
     config: SDCMapConfig,
-    event_catalog: dict[str, object],
-    *,
-    rng: np.random.Generator,
-) -> dict[str, dict[str, float] | None]:
-    if np.sum(np.isfinite(local_vals)) < config.correlation_width + 3:
-        return {"positive": None, "negative": None}
-    if np.nanstd(local_vals) == 0:
-        return {"positive": None, "negative": None}
-    if np.isnan(local_vals).any() or np.isnan(driver_vals).any():
-        return {"positive": None, "negative": None}
-
-    out: dict[str, dict[str, float] | None] = {}
-    for sign_key, indices_key in (
-        ("positive", "selected_positive_indices"),
-        ("negative", "selected_negative_indices"),
-    ):
-        event_summaries: list[dict[str, float]] = []
-        for event_idx in event_catalog[indices_key]:
-            summary = _summarize_event_window(
-                driver_vals,
-                local_vals,
-                event_idx=int(event_idx),
-                config=config,
-                rng=rng,
-            )
-            if summary is not None:
-                event_summaries.append(summary)
-        out[sign_key] = _aggregate_event_summaries(event_summaries)
-    return out
+    lag_values: np.ndarray,
+) -> dict[str, dict[str, object]]:
+    """Summarize a ``(time, cell)`` block of valid grid cells for both event classes.
+
+    Runs in worker processes when ``n_jobs > 1``. Driver windows and their permutations
+    are precomputed once, so results do not depend on how cells are split into blocks.
+    """
+    return {
+        sign_key: _summarize_class_block(
+            block_values,
+            event_windows=event_windows[sign_key],
+            config=config,
+            lag_values=lag_values,
+        )
+        for sign_key in ("positive", "negative")
+    }
 
 
 def _build_compact_layers_from_lag_stack(
@@ -664,32 +735,38 @@ def _build_compact_layers_from_lag_stack(
     best_lag = lag_values[best_indices]
     best_count = event_count_by_lag[best_indices, row_idx, col_idx]
 
-    compact["corr_mean"] = np.where(has_any, best_corr, np.nan)
-    compact["lag_mean"] = np.where(has_any, best_lag, np.nan)
-    compact["driver_rel_time_mean"] = np.where(has_any, 0.0, np.nan)
-    compact["timing_combo"] = np.where(has_any, -best_lag, np.nan)
-    compact["strong_span"] = np.where(has_any, float(int(correlation_width) - 1), np.nan)
-    compact["strong_start"] = np.where(has_any, -float((int(correlation_width) - 1) // 2), np.nan)
-    compact["dominant_sign"] = np.where(
+    compact["corr_mean"][:] = np.where(has_any, best_corr, np.nan)
+    compact["lag_mean"][:] = np.where(has_any, best_lag, np.nan)
+    compact["driver_rel_time_mean"][:] = np.where(has_any, 0.0, np.nan)
+    compact["timing_combo"][:] = np.where(has_any, -best_lag, np.nan)
+    compact["strong_span"][:] = np.where(has_any, float(int(correlation_width) - 1), np.nan)
+    compact["strong_start"][:] = np.where(has_any, -float((int(correlation_width) - 1) // 2), np.nan)
+    compact["dominant_sign"][:] = np.where(
         has_any,
         np.where(best_corr >= 0.0, 1.0, -1.0),
         np.nan,
     )
-    compact["n_selected"] = np.where(has_any, best_count, np.nan)
+    compact["n_selected"][:] = np.where(has_any, best_count, np.nan)
     return compact
 
 
-def _apply_base_state_filter(
+def _base_state_anomaly_panel(
     mapped_field: xr.DataArray,
     event_catalog: dict[str, object],
-) -> tuple[xr.DataArray, dict[str, object]]:
+) -> np.ndarray:
+    """Return the field as a contiguous ``(time, cell)`` panel relative to its base state."""
     base_state_mask = np.asarray(event_catalog["base_state_mask"], dtype=bool)
     if base_state_mask.size != int(mapped_field.sizes["time"]):
         raise ValueError("Driver event catalog is not aligned to mapped-field time coverage.")
-    if not np.any(base_state_mask):
-        return mapped_field, event_catalog
-    baseline = mapped_field.isel(time=np.where(base_state_mask)[0]).mean(dim="time")
-    return mapped_field - baseline, event_catalog
+    # Always copy so the in-place baseline subtraction never touches the caller's data.
+    panel = np.array(mapped_field.transpose("time", "lat", "lon").values, dtype=np.float64, order="C")
+    panel = panel.reshape(panel.shape[0], -1)
+    if np.any(base_state_mask):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            baseline = np.nanmean(panel[base_state_mask], axis=0)
+        panel -= baseline
+    return panel
 
 
 def compute_sdcmap_event_layers(
@@ -701,8 +778,14 @@ def compute_sdcmap_event_layers(
     event_catalog: dict[str, object] | None = None,
     manual_event_selection: Mapping[str, object] | None = None,
     progress_callback: Callable[[int, int], None] | None = None,
+    n_jobs: int | None = 1,
 ) -> dict[str, object]:
-    """Compute event-conditioned SDCMap layers for positive and negative driver classes."""
+    """Compute event-conditioned SDCMap layers for positive and negative driver classes.
+
+    Grid cells are independent, so ``n_jobs > 1`` distributes blocks of cells over
+    that many worker processes. ``n_jobs=None`` (or any value below 1) uses all
+    available CPUs.
+    """
     if mapped_field is None:
         mapped_field = sst_anom
     if mapped_field is None:
@@ -710,8 +793,10 @@ def compute_sdcmap_event_layers(
     if config is None:
         raise ValueError("`config` must be provided.")
 
-    index = pd.DatetimeIndex(mapped_field["time"].values)
-    driver = driver.reindex(index)
+    # Reuse the pandas index xarray already holds for the time coordinate.
+    index = pd.DatetimeIndex(mapped_field.get_index("time"))
+    if not driver.index.equals(index):
+        driver = driver.reindex(index)
     if driver.isna().any():
         raise ValueError("Driver and mapped-variable time coverage do not align.")
 
@@ -723,19 +808,19 @@ def compute_sdcmap_event_layers(
             config,
             manual_event_selection=manual_event_selection,
         )
-    filtered_field, event_catalog = _apply_base_state_filter(mapped_field, event_catalog)
+    field_values = _base_state_anomaly_panel(mapped_field, event_catalog)
     driver_vals = driver.to_numpy(dtype=float)
-    rng = np.random.default_rng(0)
     lag_values = np.arange(int(config.min_lag), int(config.max_lag) + 1, dtype=int)
 
-    nlat = int(filtered_field.sizes["lat"])
-    nlon = int(filtered_field.sizes["lon"])
+    nlat = int(mapped_field.sizes["lat"])
+    nlon = int(mapped_field.sizes["lon"])
     total_cells = max(0, nlat * nlon)
     callback_every = max(1, total_cells // 200) if total_cells else 1
-    class_layers = {
-        "positive": _empty_layers(nlat, nlon),
-        "negative": _empty_layers(nlat, nlon),
+    class_layer_stacks = {
+        "positive": _empty_layer_stack(nlat, nlon),
+        "negative": _empty_layer_stack(nlat, nlon),
     }
+    class_layers = {sign_key: _layer_views(stack) for sign_key, stack in class_layer_stacks.items()}
     class_lag_maps = {
         "positive": {
             "corr_by_lag": np.full((len(lag_values), nlat, nlon), np.nan, dtype=float),
@@ -747,69 +832,66 @@ def compute_sdcmap_event_layers(
         },
     }
 
+    # Skip cells that can never produce a correlation before entering the kernel.
+    valid_index = np.flatnonzero(
+        _valid_cell_mask(field_values, driver_vals, int(config.correlation_width))
+    )
+    valid_values = field_values[:, valid_index]
+    n_valid = len(valid_index)
+
+    if n_jobs is None or int(n_jobs) < 1:
+        n_workers = os.cpu_count() or 1
+    else:
+        n_workers = int(n_jobs)
+    n_workers = max(1, min(n_workers, n_valid))
+    if n_workers == 1:
+        # Large enough blocks amortize the per-window loop; progress is reported per block.
+        n_blocks = max(1, n_valid // max(callback_every, MIN_BLOCK_CELLS))
+    else:
+        n_blocks = n_workers * 4
+    # Contiguous ranges of valid cells, so each block is a column slice (a view).
+    bounds = np.linspace(0, n_valid, n_blocks + 1).astype(int)
+    blocks = [slice(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
     completed_cells = 0
-    for i in range(nlat):
-        for j in range(nlon):
-            local_vals = np.asarray(filtered_field[:, i, j].values, dtype=float)
-            if (
-                np.sum(np.isfinite(local_vals)) < config.correlation_width + 3
-                or np.nanstd(local_vals) == 0
-                or np.isnan(local_vals).any()
-                or np.isnan(driver_vals).any()
-            ):
-                completed_cells += 1
-                if progress_callback and (
-                    completed_cells == total_cells or completed_cells % callback_every == 0
-                ):
-                    progress_callback(completed_cells, total_cells)
-                continue
 
-            summary_by_class = _summarize_gridpoint_by_class(
-                driver_vals,
-                local_vals,
-                config,
-                event_catalog,
-                rng=rng,
-            )
-            for sign_key, indices_key in (
-                ("positive", "selected_positive_indices"),
-                ("negative", "selected_negative_indices"),
-            ):
-                class_summary = summary_by_class.get(sign_key)
-                if class_summary is not None:
-                    for key, value in class_summary.items():
-                        if key in class_layers[sign_key]:
-                            class_layers[sign_key][key][i, j] = float(value)
-                event_corr_rows: list[np.ndarray] = []
-                for event_idx in event_catalog[indices_key]:
-                    event_corr_rows.append(
-                        _compute_event_lag_correlations(
-                            driver_vals,
-                            local_vals,
-                            event_idx=int(event_idx),
-                            config=config,
-                            lag_values=lag_values.tolist(),
-                            rng=rng,
-                        )
-                    )
-                if not event_corr_rows:
-                    continue
-                event_corr_matrix = np.asarray(event_corr_rows, dtype=float)
-                finite_mask = np.isfinite(event_corr_matrix)
-                if not np.any(finite_mask):
-                    continue
-                counts = np.sum(finite_mask, axis=0).astype(float)
-                sums = np.where(finite_mask, event_corr_matrix, 0.0).sum(axis=0)
-                with np.errstate(divide="ignore", invalid="ignore"):
-                    mean_corr = sums / counts
-                mean_corr = np.where(counts > 0, mean_corr, np.nan)
-                class_lag_maps[sign_key]["corr_by_lag"][:, i, j] = mean_corr
-                class_lag_maps[sign_key]["event_count_by_lag"][:, i, j] = counts
-            completed_cells += 1
-            if progress_callback and (
-                completed_cells == total_cells or completed_cells % callback_every == 0
-            ):
-                progress_callback(completed_cells, total_cells)
+    def _advance(n_cells: int) -> None:
+        nonlocal completed_cells
+        if not n_cells:
+            return
+        previous = completed_cells
+        completed_cells += n_cells
+        if progress_callback and (
+            completed_cells == total_cells
+            or completed_cells // callback_every > previous // callback_every
+        ):
+            progress_callback(completed_cells, total_cells)
+
+    def _store_block(cells: slice, block_result: dict[str, dict[str, object]]) -> None:
+        targets = valid_index[cells]
+        for sign_key in ("positive", "negative"):
+            class_layer_stacks[sign_key].reshape(len(LAYER_KEYS), -1)[:, targets] = block_result[sign_key]["layers"]
+            for key in LAG_MAP_KEYS:
+                class_lag_maps[sign_key][key].reshape(len(lag_values), -1)[:, targets] = block_result[sign_key][key]
+        _advance(cells.stop - cells.start)
+
+    _advance(total_cells - n_valid)
+    block_args = (_driver_event_windows(driver_vals, config, event_catalog, lag_values), config, lag_values)
+    if n_workers == 1:
+        for cells in blocks:
+            _store_block(cells, _summarize_cell_block(valid_values[:, cells], *block_args))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {
+                executor.submit(
+                    _summarize_cell_block,
+                    valid_values[:, cells],
+                    *block_args,
+                ): cells
+                for cells in blocks
+            }
+            for future in as_completed(futures):
+                _store_block(futures[future], future.result())
 
     def _class_summary(sign_key: str) -> dict[str, object]:
         corr = np.asarray(class_layers[sign_key]["corr_mean"], dtype=float)
@@ -885,8 +967,8 @@ def derive_compact_layers(event_result: dict[str, object]) -> dict[str, np.ndarr
     for key in LAYER_KEYS:
         pos_vals = np.asarray(positive_layers[key], dtype=float)
         neg_vals = np.asarray(negative_layers[key], dtype=float)
-        compact[key] = np.where(choose_positive, pos_vals, neg_vals)
-    compact["dominant_sign"] = np.where(
+        compact[key][:] = np.where(choose_positive, pos_vals, neg_vals)
+    compact["dominant_sign"][:] = np.where(
         np.isnan(compact["corr_mean"]),
         np.nan,
         np.where(choose_positive, 1.0, -1.0),
@@ -900,6 +982,7 @@ def compute_sdcmap_layers(
     config: SDCMapConfig | None = None,
     *,
     sst_anom: xr.DataArray | None = None,
+    n_jobs: int | None = 1,
 ) -> dict[str, np.ndarray]:
     """Deprecated compatibility wrapper returning the compact combined output."""
     event_result = compute_sdcmap_event_layers(
@@ -907,6 +990,7 @@ def compute_sdcmap_layers(
         mapped_field=mapped_field,
         config=config,
         sst_anom=sst_anom,
+        n_jobs=n_jobs,
     )
     return derive_compact_layers(event_result)
 
@@ -916,8 +1000,13 @@ def save_layers_npz(
     layers: dict[str, object],
     lats: np.ndarray,
     lons: np.ndarray,
+    compressed: bool = True,
 ) -> Path:
-    """Save compact or event-class layer outputs as compressed numpy archive."""
+    """Save compact or event-class layer outputs as a numpy archive.
+
+    ``compressed=False`` stores arrays without DEFLATE, which is much faster to write
+    and read back for intermediate outputs at the cost of a larger file.
+    """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -945,5 +1034,69 @@ def save_layers_npz(
         for key, values in layers.items():
             payload[key] = np.asarray(values, dtype=float)
 
-    np.savez_compressed(path, **payload)
+    save = np.savez_compressed if compressed else np.savez
+    save(path, **payload)
+    return path
+
+
+def _layers_to_dataset(
+    layers: dict[str, object],
+    lats: np.ndarray,
+    lons: np.ndarray,
+) -> xr.Dataset:
+    coords: dict[str, np.ndarray] = {
+        "lat": np.asarray(lats, dtype=float),
+        "lon": np.asarray(lons, dtype=float),
+    }
+    data_vars: dict[str, tuple[tuple[str, ...], np.ndarray]] = {}
+    attrs: dict[str, str] = {}
+
+    if "positive" in layers and "negative" in layers:
+        attrs["event_catalog_json"] = json.dumps(layers.get("event_catalog", {}))
+        for sign_key in ("positive", "negative"):
+            for key, values in layers[sign_key]["layers"].items():
+                data_vars[f"{sign_key}__{key}"] = (("lat", "lon"), np.asarray(values, dtype=float))
+            lag_maps = layers[sign_key].get("lag_maps") or {}
+            if lag_maps:
+                lag_dim = f"{sign_key}__lag"
+                coords[lag_dim] = np.asarray(lag_maps.get("lags") or [], dtype=int)
+                for key in LAG_MAP_KEYS:
+                    if key in lag_maps:
+                        data_vars[f"{sign_key}__{key}"] = (
+                            (lag_dim, "lat", "lon"),
+                            np.asarray(lag_maps[key], dtype=float),
+                        )
+    else:
+        for key, values in layers.items():
+            data_vars[key] = (("lat", "lon"), np.asarray(values, dtype=float))
+
+    return xr.Dataset(data_vars, coords=coords, attrs=attrs)
+
+
+def save_layers_netcdf(
+    path: Path | str,
+    layers: dict[str, object],
+    lats: np.ndarray,
+    lons: np.ndarray,
+    chunk_size: int = 32,
+) -> Path:
+    """Save compact or event-class layer outputs as a chunked, compressed netCDF file.
+
+    Unlike the single-member entries of an ``.npz`` archive, each variable is stored
+    in ``chunk_size`` x ``chunk_size`` lat/lon tiles, so readers can load spatial
+    subsets (e.g. ``xr.open_dataset(path).sel(...)``) without decompressing the rest.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    dataset = _layers_to_dataset(layers, lats, lons)
+    encoding: dict[str, dict[str, object]] = {}
+    for name, variable in dataset.data_vars.items():
+        encoding[name] = {"zlib": True, "complevel": 4}
+        if all(variable.sizes.values()):
+            encoding[name]["chunksizes"] = tuple(
+                size if dim.endswith("lag") else min(size, int(chunk_size))
+                for dim, size in variable.sizes.items()
+            )
+    dataset.to_netcdf(path, engine="h5netcdf", encoding=encoding)
     return path
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import math
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import geopandas as gpd
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.cm import ScalarMappable
+from matplotlib.collections import LineCollection, QuadMesh
+from matplotlib.colors import Normalize
 from matplotlib.figure import Figure
-from mpl_toolkits.axes_grid1 import make_axes_locatable
+
+if TYPE_CHECKING:
+    import geopandas as gpd
 
 STATIC_LAYER_SPECS = (
     ("corr_mean", "A. Correlation", "RdBu_r", -1.0, 1.0),
@@ -19,24 +26,179 @@ STATIC_LAYER_SPECS = (
     ("timing_combo", "D. Timing", "BrBG", None, None),
 )
 
+# Every figure is drawn in a monospace face, falling back through common fonts.
+_MONO_FONT_RC = {
+    "font.family": "monospace",
+    "font.monospace": ["DejaVu Sans Mono", "Liberation Mono", "Courier New", "monospace"],
+}
 
-def _plot_coastline(ax: Axes, coastline: gpd.GeoDataFrame, *, linewidth: float) -> None:
-    if coastline is None or getattr(coastline, "empty", True):
-        return
 
-    geom_types = coastline.geom_type.astype(str) if hasattr(coastline, "geom_type") else []
-    polygon_mask = geom_types.isin(["Polygon", "MultiPolygon"]) if len(geom_types) else []
-    if len(polygon_mask):
-        polygon_geoms = coastline.loc[polygon_mask]
-        line_geoms = coastline.loc[~polygon_mask]
-    else:
-        polygon_geoms = coastline.iloc[0:0]
-        line_geoms = coastline
+def _coord_range(coord: np.ndarray) -> tuple[float, float]:
+    """Return ``(low, high)`` of a monotonic 1D coordinate from its endpoints."""
+    coord = np.asarray(coord, dtype=float)
+    low, high = float(coord[0]), float(coord[-1])
+    if not (np.isfinite(low) and np.isfinite(high)):
+        return float(np.nanmin(coord)), float(np.nanmax(coord))
+    return min(low, high), max(low, high)
+
+
+def _grid_bbox(lats: np.ndarray, lons: np.ndarray) -> tuple[float, float, float, float]:
+    """Return ``(lon_lo, lon_hi, lat_lo, lat_hi)`` spanned by the grid coordinates."""
+    return (*_coord_range(lons), *_coord_range(lats))
+
 
-    if len(polygon_geoms):
-        polygon_geoms.boundary.plot(ax=ax, color="black", linewidth=linewidth, zorder=3)
-    if len(line_geoms):
-        line_geoms.plot(ax=ax, color="black", linewidth=linewidth, zorder=3)
+def _coastline_segments(
+    coastline: gpd.GeoDataFrame | None,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> list[np.ndarray]:
+    """Flatten coastline geometries into ``(n, 2)`` vertex arrays; polygons use their rings.
+
+    With ``bbox=(xmin, xmax, ymin, ymax)`` only geometries intersecting it are kept, so
+    offscreen coastline never reaches the renderer.
+    """
+    if coastline is None or getattr(coastline, "empty", True):
+        return []
+    import shapely
+
+    if bbox is not None:
+        xmin, xmax, ymin, ymax = bbox
+        coastline = coastline.cx[xmin:xmax, ymin:ymax]
+
+    geoms = coastline.geometry.to_numpy()
+    parts = shapely.get_parts(geoms[~shapely.is_missing(geoms)])
+    polygonal = shapely.get_dimensions(parts) == 2
+    parts[polygonal] = shapely.boundary(parts[polygonal])
+    lines = shapely.get_parts(parts)
+    lines = lines[(shapely.get_dimensions(lines) == 1) & ~shapely.is_empty(lines)]
+    if not len(lines):
+        return []
+    coords, index = shapely.get_coordinates(lines, return_index=True)
+    return np.split(coords, np.flatnonzero(np.diff(index)) + 1)
+
+
+def _plot_coastline(ax: Axes, segments: list[np.ndarray], *, linewidth: float) -> None:
+    if not segments:
+        return
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=linewidth, antialiased=True, zorder=3), autolim=False)
+
+
+def _regular_grid_extent(lats: np.ndarray, lons: np.ndarray) -> tuple[float, float, float, float] | None:
+    """Return cell-edge ``(left, right, bottom, top)`` for an evenly spaced grid, else ``None``."""
+    edges = []
+    for coord in (np.asarray(lons, dtype=float), np.asarray(lats, dtype=float)):
+        if coord.size < 2 or not np.all(np.isfinite(coord)):
+            return None
+        steps = np.diff(coord)
+        if steps[0] == 0 or not np.allclose(steps, steps[0], rtol=1e-6, atol=0.0):
+            return None
+        half = abs(float(steps[0])) / 2.0
+        edges.extend((float(coord.min()) - half, float(coord.max()) + half))
+    return tuple(edges)
+
+
+def _cell_edges(coord: np.ndarray) -> np.ndarray:
+    """Return the ``n + 1`` cell edges around ``n`` cell centers, halfway between neighbours."""
+    coord = np.asarray(coord, dtype=float)
+    if coord.size < 2:
+        return np.concatenate([coord - 0.5, coord + 0.5])
+    mid = 0.5 * (coord[:-1] + coord[1:])
+    return np.concatenate([[coord[0] - (mid[0] - coord[0])], mid, [coord[-1] + (coord[-1] - mid[-1])]])
+
+
+def _ascending_field(values: np.ndarray, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Flip a ``(lat, lon)`` field so both axes ascend, as ``imshow(origin="lower")`` expects."""
+    if lats[0] > lats[-1]:
+        values = values[::-1, :]
+    if lons[0] > lons[-1]:
+        values = values[:, ::-1]
+    return values
+
+
+def _draw_field(ax: Axes, lats: np.ndarray, lons: np.ndarray, values: np.ndarray, **kwargs):
+    """Draw a gridded field, as a single image when the grid is regular.
+
+    Regular grids go through ``imshow``, which blits one image instead of building a
+    quad per cell; irregular grids fall back to ``pcolormesh``. The field is always
+    rasterized so vector outputs keep only axes, labels and coastlines as vectors.
+    Values are drawn as float32, which is ample for 8-bit colormapping.
+    """
+    values = np.asarray(values, dtype=np.float32)
+    extent = _regular_grid_extent(lats, lons)
+    if extent is None:
+        # Explicit edges let ``pcolormesh`` skip its own shading inference and edge grid.
+        mesh = ax.pcolormesh(_cell_edges(lons), _cell_edges(lats), values, shading="flat", **kwargs)
+        mesh.set_rasterized(True)
+        return mesh
+
+    image = ax.imshow(
+        _ascending_field(values, lats, lons),
+        origin="lower",
+        extent=extent,
+        aspect="auto",
+        interpolation="nearest",
+        **kwargs,
+    )
+    image.set_rasterized(True)
+    return image
+
+
+def _field_norm(values: np.ndarray, vmin: float | None, vmax: float | None) -> Normalize:
+    """Build a fixed ``Normalize``, resolving autoscaled limits from finite values once."""
+    if vmin is None or vmax is None:
+        finite = np.asarray(values, dtype=np.float32)
+        finite = finite[np.isfinite(finite)]
+        low, high = (float(finite.min()), float(finite.max())) if finite.size else (0.0, 1.0)
+        vmin = low if vmin is None else vmin
+        vmax = high if vmax is None else vmax
+    return Normalize(vmin=float(vmin), vmax=float(vmax))
+
+
+def _render_field_rgba(
+    values: np.ndarray,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    bbox: tuple[float, float, float, float],
+    figsize: tuple[float, float],
+    dpi: float,
+    cmap: str,
+    norm: Normalize,
+) -> np.ndarray:
+    """Render one field over ``bbox`` to an RGBA array; runs in worker processes."""
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    fig.patch.set_alpha(0.0)
+    ax = fig.add_axes((0.0, 0.0, 1.0, 1.0))
+    ax.set_axis_off()
+    _draw_field(ax, lats, lons, values, cmap=cmap, norm=norm)
+    ax.set_xlim(bbox[0], bbox[1])
+    ax.set_ylim(bbox[2], bbox[3])
+    canvas.draw()
+    return np.array(canvas.buffer_rgba())
+
+
+def _prepare_output_path(out_path: Path | str | None) -> Path | None:
+    """Resolve ``out_path`` and create its parent directory, or return ``None``."""
+    if out_path is None:
+        return None
+    save_path = Path(out_path)
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    return save_path
+
+
+def _save_figure(fig: Figure, save_path: Path) -> None:
+    """Save with the layout and tight crop resolved in one layout draw.
+
+    The layout engine is detached while saving, so ``savefig`` renders straight away
+    instead of re-running the layout in a throwaway draw of its own.
+    """
+    engine = fig.get_layout_engine()
+    fig.draw_without_rendering()
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.02)
+    fig.set_layout_engine(None)
+    try:
+        fig.savefig(save_path, dpi=180, bbox_inches=bbox)
+    finally:
+        fig.set_layout_engine(engine)
 
 
 def plot_layer_maps_compact(
@@ -47,74 +209,99 @@ def plot_layer_maps_compact(
     out_path: Path | str | None = None,
     title: str = "SDCMap-style layers (driver vs mapped-variable anomalies)",
     return_handles: bool = False,
+    parallel: bool = False,
 ) -> Path | tuple[Figure, np.ndarray, list[Axes]] | None:
     """Render compact 2x2 layer panels with full-height per-panel colorbars.
 
+    With ``parallel=True`` each field is rendered to an RGBA tile in its own worker
+    process and composited into the panels; this pays off on large grids, where
+    color-mapping dominates. Colorbars and coastlines are still drawn directly.
+
     When ``return_handles=True``, returns ``(fig, axes, colorbar_axes)`` so callers
     can directly access subplot artists. Otherwise, the figure is closed and the
     saved output path (or ``None`` if ``out_path`` is not provided) is returned.
+
+    Vector formats (PDF/SVG) come out mixed: the gridded fields are embedded as
+    rasters at the save DPI while axes, text and coastlines stay vector.
     """
-    save_path: Path | None = None
-    if out_path is not None:
-        save_path = Path(out_path)
-        save_path.parent.mkdir(parents=True, exist_ok=True)
+    save_path = _prepare_output_path(out_path)
 
-    mono_font = ["DejaVu Sans Mono", "Liberation Mono", "Courier New", "monospace"]
+    lon_lo, lon_hi, lat_lo, lat_hi = _grid_bbox(lats, lons)
+    # Geometry is converted once and shared by every panel.
+    coastline_segments = _coastline_segments(coastline, (lon_lo, lon_hi, lat_lo, lat_hi))
 
-    with plt.rc_context({"font.family": "monospace", "font.monospace": mono_font}):
-        fig, axes = plt.subplots(
-            2,
-            2,
-            figsize=(14, 7.6),
-            sharex=True,
-            sharey=True,
-            constrained_layout=False,
-        )
+    with plt.rc_context(_MONO_FONT_RC):
+        fig = plt.figure(figsize=(14, 7.6), constrained_layout=True)
+        fig.get_layout_engine().set(w_pad=0.02, h_pad=0.02, wspace=0.02, hspace=0.02)
+        # Maps and slim colorbar columns share one grid so rows and columns stay aligned.
+        grid = fig.add_gridspec(2, 4, width_ratios=[1.0, 0.026, 1.0, 0.026])
+        axes = np.array([[fig.add_subplot(grid[row, 2 * col]) for col in range(2)] for row in range(2)], dtype=object)
+        cbar_axes: list[Axes] = [fig.add_subplot(grid[row, 2 * col + 1]) for row in range(2) for col in range(2)]
 
         layer_defs = STATIC_LAYER_SPECS
-        cbar_axes: list[Axes] = []
-
-        for idx, (ax, (key, subplot_title, cmap, vmin, vmax)) in enumerate(zip(axes.ravel(), layer_defs)):
-            row, col = divmod(idx, 2)
-
-            mesh = ax.pcolormesh(lons, lats, layers[key], shading="auto", cmap=cmap, vmin=vmin, vmax=vmax)
-            _plot_coastline(ax, coastline, linewidth=0.45)
-
+        # Color scales are resolved once up front and shared by the field and colorbar.
+        norms = [_field_norm(layers[key], vmin, vmax) for key, _title, _cmap, vmin, vmax in layer_defs]
+
+        tiles: list[np.ndarray] | None = None
+        if parallel:
+            bbox = (lon_lo, lon_hi, lat_lo, lat_hi)
+            # Tiles match the on-page panel size at the save DPI.
+            tile_size = (fig.get_figwidth() / 2.0, fig.get_figheight() / 2.0)
+            with ProcessPoolExecutor(max_workers=len(layer_defs)) as executor:
+                futures = [
+                    executor.submit(
+                        _render_field_rgba,
+                        np.asarray(layers[key]),
+                        lats,
+                        lons,
+                        bbox,
+                        tile_size,
+                        180,
+                        cmap,
+                        norm,
+                    )
+                    for (key, _subplot_title, cmap, _vmin, _vmax), norm in zip(layer_defs, norms)
+                ]
+                tiles = [future.result() for future in futures]
+
+        flat_axes = axes.ravel()
+        if tiles is None:
+            meshes = [
+                _draw_field(ax, lats, lons, layers[key], cmap=cmap, norm=norm)
+                for ax, (key, _title, cmap, _vmin, _vmax), norm in zip(flat_axes, layer_defs, norms)
+            ]
+        else:
+            for ax, tile in zip(flat_axes, tiles):
+                ax.imshow(tile, extent=(lon_lo, lon_hi, lat_lo, lat_hi), aspect="auto").set_rasterized(True)
+            meshes = [
+                ScalarMappable(norm=norm, cmap=cmap)
+                for (_key, _title, cmap, _vmin, _vmax), norm in zip(layer_defs, norms)
+            ]
+
+        for ax, (_key, subplot_title, _cmap, _vmin, _vmax) in zip(flat_axes, layer_defs):
+            _plot_coastline(ax, coastline_segments, linewidth=0.45)
             ax.set_title(subplot_title, fontsize=10)
-            ax.set_xlim(float(np.nanmin(lons)), float(np.nanmax(lons)))
-            ax.set_ylim(float(np.nanmin(lats)), float(np.nanmax(lats)))
-
-            if row == 0:
-                ax.tick_params(axis="x", which="both", labelbottom=False, bottom=False)
-                ax.set_xlabel("")
-            else:
-                ax.set_xlabel("Longitude", fontsize=9)
-                ax.tick_params(axis="x", labelsize=8)
-
-            if col == 0:
-                ax.set_ylabel("Latitude", fontsize=9)
-                ax.tick_params(axis="y", labelsize=8)
-            else:
-                ax.tick_params(axis="y", which="both", labelleft=False, left=False)
-                ax.set_ylabel("")
-
-            divider = make_axes_locatable(ax)
-            cax = divider.append_axes("right", size="2.6%", pad=0.035)
+        plt.setp(flat_axes, xlim=(lon_lo, lon_hi), ylim=(lat_lo, lat_hi))
+
+        # Tick and label styling is shared along rows and columns of the panel grid.
+        for ax in axes[0, :]:
+            ax.tick_params(axis="x", which="both", labelbottom=False, bottom=False)
+        for ax in axes[1, :]:
+            ax.set_xlabel("Longitude", fontsize=9)
+            ax.tick_params(axis="x", labelsize=8)
+        for ax in axes[:, 0]:
+            ax.set_ylabel("Latitude", fontsize=9)
+            ax.tick_params(axis="y", labelsize=8)
+        for ax in axes[:, 1]:
+            ax.tick_params(axis="y", which="both", labelleft=False, left=False)
+
+        for mesh, cax in zip(meshes, cbar_axes):
             cbar = fig.colorbar(mesh, cax=cax)
             cbar.ax.tick_params(labelsize=8)
-            cbar_axes.append(cax)
-
-        fig.subplots_adjust(
-            left=0.052,
-            right=0.996,
-            bottom=0.075,
-            top=0.90,
-            wspace=0.02,
-            hspace=0.06,
-        )
+
         fig.suptitle(title, fontsize=12)
         if save_path is not None:
-            fig.savefig(save_path, dpi=180, bbox_inches="tight", pad_inches=0.02)
+            _save_figure(fig, save_path)
 
         if return_handles:
             return fig, axes, cbar_axes
@@ -125,6 +312,43 @@ def plot_layer_maps_compact(
     return None
 
 
+def update_layer_maps_compact(
+    fig: Figure,
+    axes: np.ndarray,
+    layers: dict[str, np.ndarray],
+    lats: np.ndarray,
+    lons: np.ndarray,
+    out_path: Path | str | None = None,
+) -> Path | None:
+    """Swap new layer values into a figure from ``plot_layer_maps_compact``.
+
+    ``fig`` and ``axes`` come from ``plot_layer_maps_compact(..., return_handles=True)``
+    on the same grid. Existing field artists get the new values and color limits and
+    their colorbars follow, so repeated renders skip figure, axes and colorbar setup.
+    Returns the saved path, or ``None`` if ``out_path`` is not provided.
+    """
+    save_path = _prepare_output_path(out_path)
+
+    for ax, (key, _title, _cmap, vmin, vmax) in zip(np.ravel(axes), STATIC_LAYER_SPECS):
+        values = np.asarray(layers[key], dtype=np.float32)
+        norm = _field_norm(values, vmin, vmax)
+        if ax.images:
+            field = ax.images[0]
+            if field.get_array().ndim != 2:
+                raise ValueError("Figures rendered with `parallel=True` cannot be updated in place.")
+            field.set_data(_ascending_field(values, lats, lons))
+        else:
+            field = next(artist for artist in ax.collections if isinstance(artist, QuadMesh))
+            field.set_array(values)
+        # ``set_clim`` notifies the attached colorbar, which redraws its scale.
+        field.set_clim(norm.vmin, norm.vmax)
+
+    if save_path is not None:
+        with plt.rc_context(_MONO_FONT_RC):
+            _save_figure(fig, save_path)
+    return save_path
+
+
 def plot_single_layer_map(
     layers: dict[str, np.ndarray],
     layer_key: str,
@@ -136,10 +360,7 @@ def plot_single_layer_map(
     return_handles: bool = False,
 ) -> Path | tuple[Figure, Axes] | None:
     """Render one static SDC-map summary layer."""
-    save_path: Path | None = None
-    if out_path is not None:
-        save_path = Path(out_path)
-        save_path.parent.mkdir(parents=True, exist_ok=True)
+    save_path = _prepare_output_path(out_path)
 
     spec_lookup = {key: (label, cmap, vmin, vmax) for key, label, cmap, vmin, vmax in STATIC_LAYER_SPECS}
     if layer_key not in spec_lookup:
@@ -147,22 +368,22 @@ def plot_single_layer_map(
         raise ValueError(f"Unsupported layer '{layer_key}'. Supported static layers: {supported}.")
     label, cmap, vmin, vmax = spec_lookup[layer_key]
 
-    mono_font = ["DejaVu Sans Mono", "Liberation Mono", "Courier New", "monospace"]
-    with plt.rc_context({"font.family": "monospace", "font.monospace": mono_font}):
-        fig, ax = plt.subplots(1, 1, figsize=(8.4, 4.8), constrained_layout=False)
-        mesh = ax.pcolormesh(lons, lats, layers[layer_key], shading="auto", cmap=cmap, vmin=vmin, vmax=vmax)
-        _plot_coastline(ax, coastline, linewidth=0.5)
+    lon_lo, lon_hi, lat_lo, lat_hi = _grid_bbox(lats, lons)
+    coastline_segments = _coastline_segments(coastline, (lon_lo, lon_hi, lat_lo, lat_hi))
+    with plt.rc_context(_MONO_FONT_RC):
+        fig, ax = plt.subplots(1, 1, figsize=(8.4, 4.8), constrained_layout=True)
+        mesh = _draw_field(ax, lats, lons, layers[layer_key], cmap=cmap, norm=_field_norm(layers[layer_key], vmin, vmax))
+        _plot_coastline(ax, coastline_segments, linewidth=0.5)
+        ax.set_xlim(lon_lo, lon_hi)
+        ax.set_ylim(lat_lo, lat_hi)
         ax.set_title(title or label, fontsize=12)
         ax.set_xlabel("Longitude", fontsize=10)
         ax.set_ylabel("Latitude", fontsize=10)
         ax.tick_params(axis="both", labelsize=9)
-        divider = make_axes_locatable(ax)
-        cax = divider.append_axes("bottom", size="6%", pad=0.42)
-        cbar = fig.colorbar(mesh, cax=cax, orientation="horizontal")
+        cbar = fig.colorbar(mesh, ax=ax, location="bottom", fraction=0.06, pad=0.02)
         cbar.ax.tick_params(labelsize=8)
-        fig.subplots_adjust(left=0.08, right=0.99, bottom=0.16, top=0.90)
         if save_path is not None:
-            fig.savefig(save_path, dpi=180, bbox_inches="tight", pad_inches=0.02)
+            _save_figure(fig, save_path)
 
         if return_handles:
             return fig, ax
@@ -184,10 +405,7 @@ def plot_correlation_maps_by_lag(
     ncols: int = 4,
 ) -> Path | tuple[Figure, np.ndarray] | None:
     """Render one correlation map per lag for a single event class."""
-    save_path: Path | None = None
-    if out_path is not None:
-        save_path = Path(out_path)
-        save_path.parent.mkdir(parents=True, exist_ok=True)
+    save_path = _prepare_output_path(out_path)
 
     lag_values = np.asarray(lag_maps.get("lags") or [], dtype=int)
     corr_by_lag = np.asarray(lag_maps.get("corr_by_lag"), dtype=float)
@@ -198,39 +416,31 @@ def plot_correlation_maps_by_lag(
     n_panels = max(1, len(lag_values))
     nrows = math.ceil(n_panels / ncols)
 
-    mono_font = ["DejaVu Sans Mono", "Liberation Mono", "Courier New", "monospace"]
-    with plt.rc_context({"font.family": "monospace", "font.monospace": mono_font}):
+    lon_lo, lon_hi, lat_lo, lat_hi = _grid_bbox(lats, lons)
+    coastline_segments = _coastline_segments(coastline, (lon_lo, lon_hi, lat_lo, lat_hi))
+    with plt.rc_context(_MONO_FONT_RC):
         fig, axes = plt.subplots(
             nrows,
             ncols,
             figsize=(4.2 * ncols, 3.1 * nrows),
-            sharex=True,
-            sharey=True,
-            constrained_layout=False,
+            constrained_layout=True,
         )
         axes_array = np.atleast_2d(np.asarray(axes, dtype=object))
         flat_axes = axes_array.ravel()
         meshes = []
+        corr_norm = Normalize(vmin=-1.0, vmax=1.0)
 
         for idx, ax in enumerate(flat_axes):
             if idx >= len(lag_values):
                 ax.axis("off")
                 continue
             lag = int(lag_values[idx])
-            mesh = ax.pcolormesh(
-                lons,
-                lats,
-                corr_by_lag[idx],
-                shading="auto",
-                cmap="RdBu_r",
-                vmin=-1.0,
-                vmax=1.0,
-            )
-            _plot_coastline(ax, coastline, linewidth=0.45)
+            mesh = _draw_field(ax, lats, lons, corr_by_lag[idx], cmap="RdBu_r", norm=corr_norm)
+            _plot_coastline(ax, coastline_segments, linewidth=0.45)
             meshes.append(mesh)
             ax.set_title(f"Lag {lag:+d}", fontsize=10)
-            ax.set_xlim(float(np.nanmin(lons)), float(np.nanmax(lons)))
-            ax.set_ylim(float(np.nanmin(lats)), float(np.nanmax(lats)))
+            ax.set_xlim(lon_lo, lon_hi)
+            ax.set_ylim(lat_lo, lat_hi)
             row, col = divmod(idx, ncols)
             if row == nrows - 1:
                 ax.set_xlabel("Longitude", fontsize=9)
@@ -248,18 +458,17 @@ def plot_correlation_maps_by_lag(
             cbar = fig.colorbar(
                 active_mesh,
                 ax=list(flat_axes[: len(lag_values)]),
-                orientation="horizontal",
+                location="bottom",
                 fraction=0.05,
-                pad=0.06,
+                pad=0.02,
                 aspect=40,
             )
             cbar.set_label("Correlation", fontsize=9)
             cbar.ax.tick_params(labelsize=8)
 
-        fig.subplots_adjust(left=0.055, right=0.995, bottom=0.10, top=0.90, wspace=0.04, hspace=0.12)
         fig.suptitle(title, fontsize=12)
         if save_path is not None:
-            fig.savefig(save_path, dpi=180, bbox_inches="tight", pad_inches=0.02)
+            _save_figure(fig, save_path)
 
         if return_handles:
             return fig, axes_array
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from argparse import Namespace
 from pathlib import Path
 
@@ -14,6 +16,11 @@ def test_parse_args_defaults():
     assert args.field_dataset == "ncep_air"
 
 
+def test_import_does_not_load_geopandas():
+    code = "import sys, sdcpy_map.cli; sys.exit('geopandas' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
+
+
 def test_main_wires_selected_datasets(monkeypatch, tmp_path: Path, capsys):
     args = Namespace(
         data_dir=tmp_path / "data",
@@ -1,19 +1,23 @@
 import subprocess
 from pathlib import Path
 
+import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pytest
 import xarray as xr
+from shapely.geometry import LineString
 
 from sdcpy_map.config import SDCMapConfig
 from sdcpy_map.datasets import (
     DEFAULT_DRIVER_DATASET_KEY,
     DEFAULT_FIELD_DATASET_KEY,
+    _parse_nino34_csv_driver,
     align_driver_to_field,
     download_if_missing,
     fetch_public_example_data,
     grid_coordinates,
+    load_coastline,
     load_driver_series,
     load_field_anomaly_subset,
 )
@@ -36,8 +40,62 @@ def test_load_driver_series_psl_table(tmp_path: Path):
     assert pd.Timestamp("1949-01-01") not in driver.index
 
 
-def test_load_driver_series_nino34_csv(tmp_path: Path):
-    csv = "date,value\n2015-10-01,2.0\n2015-11-01,2.5\n2015-12-01,2.3\n"
+def test_load_driver_series_psl_table_ignores_trailer(tmp_path: Path):
+    pdo_table = """ 1948 1949
+ 1948 -0.10 0.20 0.30 0.40 0.50 0.60 0.70 0.80 0.90 1.00 1.10 1.20
+ 1949 0.50 0.60 -9.90 -9.90 -9.90 -9.90 -9.90 -9.90 -9.90 -9.90 -9.90 -9.90
+  -9.90
+ PDO index
+ https://psl.noaa.gov/data/correlation/pdo.data
+"""
+    path = tmp_path / "pdo.data"
+    path.write_text(pdo_table, encoding="utf-8")
+
+    config = SDCMapConfig(time_start="1948-01-01", time_end="1949-12-01")
+    driver = load_driver_series(path, config=config, driver_key="pdo")
+
+    assert len(driver) == 14
+    assert driver.index[-1] == pd.Timestamp("1949-02-01")
+    assert np.isclose(driver.loc["1949-02-01"], 0.60)
+
+
+def test_load_driver_series_psl_table_uses_declared_missing_code(tmp_path: Path):
+    nino_table = """ 1950 1950
+ 1950 -1.53 -1.34 -1.16 -1.18 -1.07 -0.85 -0.54 -0.42 -0.39 -0.44 -99.99 -99.99
+  -99.99
+ Nino Anom 3.4 Index
+"""
+    path = tmp_path / "nina34.anom.data"
+    path.write_text(nino_table, encoding="utf-8")
+
+    config = SDCMapConfig(time_start="1950-01-01", time_end="1950-12-01")
+    driver = load_driver_series(path, config=config, driver_key="pdo")
+
+    assert len(driver) == 10
+    assert driver.index[-1] == pd.Timestamp("1950-10-01")
+
+
+@pytest.mark.parametrize("header", ["1948 2025\n", ""])
+def test_load_driver_series_psl_table_tolerates_header_row_count_mismatch(tmp_path: Path, header: str):
+    pdo_table = header + """1948 -0.10 0.20 0.30 0.40 0.50 0.60 0.70 0.80 0.90 1.00 1.10 1.20
+1949 -9.90 -0.20 -0.30 -0.40 -0.50 -0.60 -0.70 -0.80 -0.90 -1.00 -1.10 -1.20
+  -9.90
+ PDO index
+"""
+    path = tmp_path / "pdo.data"
+    path.write_text(pdo_table, encoding="utf-8")
+
+    config = SDCMapConfig(time_start="1948-01-01", time_end="1949-12-01")
+    driver = load_driver_series(path, config=config, driver_key="pdo")
+
+    assert len(driver) == 23
+    assert pd.Timestamp("1949-01-01") not in driver.index
+    assert np.isclose(driver.loc["1949-12-01"], -1.20)
+
+
+@pytest.mark.parametrize("header", ["date,value", "Date,  Nino34 anomaly"])
+def test_load_driver_series_nino34_csv(tmp_path: Path, header: str):
+    csv = header + "\n2015-10-01,2.0\n2015-11-01,2.5\n2015-12-01,2.3\n"
     path = tmp_path / "nino.csv"
     path.write_text(csv, encoding="utf-8")
 
@@ -48,6 +106,21 @@ def test_load_driver_series_nino34_csv(tmp_path: Path):
     assert np.isclose(driver.loc["2015-11-01"], 2.5)
 
 
+def test_parse_nino34_csv_driver_pyarrow_matches_c_engine(tmp_path: Path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    csv = "Date,  Nino34 anomaly\n2015-10-01,2.0\n2015-11-01,-9999.0\n2015-12-01,2.3\n"
+    path = tmp_path / "nino.csv"
+    path.write_text(csv, encoding="utf-8")
+
+    monkeypatch.setattr("sdcpy_map.datasets._HAS_PYARROW", True)
+    with_pyarrow = _parse_nino34_csv_driver(path)
+    monkeypatch.setattr("sdcpy_map.datasets._HAS_PYARROW", False)
+    with_c = _parse_nino34_csv_driver(path)
+
+    pd.testing.assert_series_equal(with_pyarrow, with_c)
+    assert len(with_c) == 2
+
+
 def test_load_field_anomaly_subset_wraps_longitude_and_subsets(tmp_path: Path):
     time = pd.date_range("2000-01-01", periods=24, freq="MS")
     lat = np.array([30.0, 20.0, 10.0, 0.0])  # descending
@@ -87,6 +160,91 @@ def test_load_field_anomaly_subset_wraps_longitude_and_subsets(tmp_path: Path):
     assert np.allclose(month_mean.values, 0.0, atol=1e-10)
 
 
+def test_load_field_anomaly_subset_applies_strides_per_cell(tmp_path: Path):
+    time = pd.date_range("2000-01-01", periods=24, freq="MS")
+    lat = np.array([-10.0, -5.0, 0.0, 5.0])
+    lon = np.array([0.0, 10.0, 20.0, 30.0, 40.0])
+    vals = np.random.RandomState(1).randn(len(time), len(lat), len(lon))
+    path = tmp_path / "air.nc"
+    xr.Dataset({"air": (("time", "lat", "lon"), vals)}, coords={"time": time, "lat": lat, "lon": lon}).to_netcdf(path)
+
+    base = {
+        "time_start": "2000-01-01",
+        "time_end": "2001-12-01",
+        "lat_min": -10,
+        "lat_max": 5,
+        "lon_min": -180,
+        "lon_max": 180,
+    }
+    full = load_field_anomaly_subset(path, config=SDCMapConfig(**base), field_key="ncep_air")
+    strided = load_field_anomaly_subset(
+        path,
+        config=SDCMapConfig(**base, lat_stride=2, lon_stride=2),
+        field_key="ncep_air",
+    )
+
+    assert strided.shape == (24, 2, 3)
+    np.testing.assert_allclose(strided.values, full.values[:, ::2, ::2])
+
+
+def test_load_field_anomaly_subset_promotes_integer_fields(tmp_path: Path):
+    time = pd.date_range("2000-01-01", periods=24, freq="MS")
+    lat = np.array([0.0, 5.0])
+    lon = np.array([0.0, 10.0])
+    vals = np.arange(len(time) * len(lat) * len(lon), dtype=np.int64).reshape(len(time), len(lat), len(lon))
+    path = tmp_path / "air.nc"
+    xr.Dataset({"air": (("time", "lat", "lon"), vals)}, coords={"time": time, "lat": lat, "lon": lon}).to_netcdf(path)
+
+    config = SDCMapConfig(
+        time_start="2000-01-01",
+        time_end="2001-12-01",
+        lat_min=0,
+        lat_max=5,
+        lon_min=-180,
+        lon_max=180,
+    )
+    field = load_field_anomaly_subset(path, config=config, field_key="ncep_air")
+
+    assert field.dtype == np.float64
+    np.testing.assert_allclose(field.groupby("time.month").mean("time").values, 0.0)
+
+
+def test_load_field_anomaly_subset_reads_netcdf3(tmp_path: Path):
+    time = pd.date_range("2000-01-01", periods=24, freq="MS")
+    lat = np.array([-10.0, -5.0, 0.0, 5.0])
+    lon = np.array([0.0, 10.0, 20.0])
+    vals = np.random.RandomState(2).randn(len(time), len(lat), len(lon))
+    path = tmp_path / "air.nc"
+    xr.Dataset({"air": (("time", "lat", "lon"), vals)}, coords={"time": time, "lat": lat, "lon": lon}).to_netcdf(
+        path, engine="scipy"
+    )
+
+    config = SDCMapConfig(
+        time_start="2000-01-01",
+        time_end="2001-12-01",
+        lat_min=-10,
+        lat_max=5,
+        lon_min=-180,
+        lon_max=180,
+    )
+    field = load_field_anomaly_subset(path, config=config, field_key="ncep_air")
+
+    assert field.shape == (24, 4, 3)
+
+
+def test_load_coastline_reads_line_geometries(tmp_path: Path):
+    path = tmp_path / "coast.shp"
+    gpd.GeoDataFrame(
+        geometry=[LineString([(-170, -20), (-70, 20)]), LineString([(0, 0), (10, 5)])],
+        crs="EPSG:4326",
+    ).to_file(path)
+
+    coastline = load_coastline(path)
+
+    assert len(coastline) == 2
+    assert set(coastline.geom_type) == {"LineString"}
+
+
 def test_align_driver_to_field_success_and_failure():
     idx = pd.date_range("2000-01-01", periods=6, freq="MS")
     driver = pd.Series(np.arange(6), index=idx)
@@ -236,6 +394,36 @@ def test_existing_file_with_verify_remote_and_unknown_size_uses_cache(tmp_path:
     assert path.read_bytes() == b"cached"
 
 
+def test_verify_remote_reuses_recent_head_result(tmp_path: Path, monkeypatch):
+    path = tmp_path / "dataset.bin"
+    path.write_bytes(b"cached")
+    state = {"head_calls": 0}
+
+    class _FakeHeadResponse:
+        headers = {"Content-Length": "6"}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    def fake_urlopen(request, timeout=20):
+        state["head_calls"] += 1
+        return _FakeHeadResponse()
+
+    monkeypatch.setattr("sdcpy_map.datasets.urlopen", fake_urlopen)
+
+    url = "https://example.invalid/data.bin"
+    download_if_missing(url, path, verify_remote=True)
+    download_if_missing(url, path, verify_remote=True)
+    assert state["head_calls"] == 1
+    assert (tmp_path / ".cache.json").exists()
+
+    download_if_missing(url, path, verify_remote=True, remote_check_max_age=0)
+    assert state["head_calls"] == 2
+
+
 def test_missing_file_with_offline_true_raises(tmp_path: Path):
     path = tmp_path / "missing.bin"
     with pytest.raises(RuntimeError, match="Offline mode"):
@@ -284,3 +472,21 @@ def test_fetch_public_example_data_validates_keys(tmp_path: Path):
         fetch_public_example_data(tmp_path, driver_key="missing", field_key=DEFAULT_FIELD_DATASET_KEY)
     with pytest.raises(ValueError):
         fetch_public_example_data(tmp_path, driver_key=DEFAULT_DRIVER_DATASET_KEY, field_key="missing")
+
+
+def test_fetch_public_example_data_downloads_selected_sources(tmp_path: Path, monkeypatch):
+    requested: list[str] = []
+
+    def fake_download(url, destination):
+        requested.append(url)
+        return destination
+
+    monkeypatch.setattr("sdcpy_map.datasets.download_if_missing", fake_download)
+
+    paths = fetch_public_example_data(tmp_path, driver_key="nao", field_key="ersstv5_sst")
+
+    assert list(paths) == ["driver", "field", "coastline"]
+    assert paths["driver"] == tmp_path / "nao.data"
+    assert paths["field"] == tmp_path / "sst.mnmean.nc"
+    assert paths["coastline"] == tmp_path / "ne_110m_coastline.zip"
+    assert len(requested) == 3
@@ -1,8 +1,11 @@
+import json
+import zipfile
 from pathlib import Path
 
 import numpy as np
+import xarray as xr
 
-from sdcpy_map.layers import save_layers_npz
+from sdcpy_map.layers import save_layers_netcdf, save_layers_npz
 
 
 def test_save_layers_npz_roundtrip(tmp_path: Path):
@@ -19,3 +22,45 @@ def test_save_layers_npz_roundtrip(tmp_path: Path):
     assert loaded["lat"].shape == (2,)
     assert loaded["lon"].shape == (3,)
     assert loaded["corr_mean"].shape == (2, 3)
+
+
+def test_save_layers_npz_uncompressed(tmp_path: Path):
+    layers = {"corr_mean": np.arange(6, dtype=float).reshape(2, 3)}
+    lats = np.array([0.0, 1.0])
+    lons = np.array([10.0, 20.0, 30.0])
+
+    out = save_layers_npz(tmp_path / "layers.npz", layers=layers, lats=lats, lons=lons, compressed=False)
+
+    with zipfile.ZipFile(out) as archive:
+        assert {info.compress_type for info in archive.infolist()} == {zipfile.ZIP_STORED}
+    np.testing.assert_array_equal(np.load(out)["corr_mean"], layers["corr_mean"])
+
+
+def test_save_layers_netcdf_roundtrip_event_layers(tmp_path: Path):
+    layers = {
+        "corr_mean": np.arange(6, dtype=float).reshape(2, 3),
+        "lag_mean": np.ones((2, 3), dtype=float),
+    }
+    lag_maps = {
+        "lags": [-1, 0, 1],
+        "corr_by_lag": np.zeros((3, 2, 3), dtype=float),
+        "event_count_by_lag": np.ones((3, 2, 3), dtype=float),
+    }
+    result = {
+        "positive": {"layers": layers, "lag_maps": lag_maps},
+        "negative": {"layers": layers, "lag_maps": lag_maps},
+        "event_catalog": {"selection_mode": "auto"},
+    }
+
+    out = save_layers_netcdf(
+        tmp_path / "layers.nc",
+        layers=result,
+        lats=np.array([0.0, 1.0]),
+        lons=np.array([10.0, 20.0, 30.0]),
+    )
+
+    with xr.open_dataset(out) as loaded:
+        np.testing.assert_allclose(loaded["positive__corr_mean"].values, layers["corr_mean"])
+        assert loaded["negative__corr_by_lag"].dims == ("negative__lag", "lat", "lon")
+        assert loaded["positive__lag"].values.tolist() == [-1, 0, 1]
+        assert json.loads(loaded.attrs["event_catalog_json"]) == {"selection_mode": "auto"}
@@ -339,3 +339,23 @@ def test_compute_sdcmap_event_layers_requires_time_alignment():
 
     with pytest.raises(ValueError):
         compute_sdcmap_event_layers(driver=driver, mapped_field=mapped, config=SDCMapConfig())
+
+
+def test_compute_sdcmap_event_layers_parallel_matches_serial():
+    config = SDCMapConfig(correlation_width=5, n_positive_peaks=2, n_negative_peaks=2, n_permutations=19, alpha=0.2)
+
+    serial = compute_sdcmap_event_layers(driver=_synthetic_driver(), mapped_field=_synthetic_field(), config=config)
+    parallel = compute_sdcmap_event_layers(
+        driver=_synthetic_driver(),
+        mapped_field=_synthetic_field(),
+        config=config,
+        n_jobs=2,
+    )
+
+    for sign_key in ("positive", "negative"):
+        for key, values in serial[sign_key]["layers"].items():
+            np.testing.assert_allclose(values, parallel[sign_key]["layers"][key])
+        np.testing.assert_allclose(
+            serial[sign_key]["lag_maps"]["corr_by_lag"],
+            parallel[sign_key]["lag_maps"]["corr_by_lag"],
+        )
@@ -2,9 +2,19 @@ from pathlib import Path
 
 import geopandas as gpd
 import numpy as np
-from shapely.geometry import LineString
+from matplotlib.collections import LineCollection, QuadMesh
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from matplotlib.layout_engine import ConstrainedLayoutEngine
+from shapely.geometry import LineString, MultiLineString, Polygon
 
-from sdcpy_map.plotting import plot_correlation_maps_by_lag, plot_layer_maps_compact
+from sdcpy_map.plotting import (
+    _coastline_segments,
+    plot_correlation_maps_by_lag,
+    plot_layer_maps_compact,
+    plot_single_layer_map,
+    update_layer_maps_compact,
+)
 
 
 def _sample_inputs():
@@ -52,6 +62,24 @@ def test_plot_layer_maps_compact_saves_png(tmp_path: Path):
     assert out_path.stat().st_size > 0
 
 
+def test_plot_layer_maps_compact_rasterizes_fields_in_vector_output(tmp_path: Path):
+    layers, lats, lons, coastline = _sample_inputs()
+    out_path = tmp_path / "layers.pdf"
+
+    fig, axes, _cbar_axes = plot_layer_maps_compact(
+        layers=layers,
+        lats=lats,
+        lons=lons,
+        coastline=coastline,
+        out_path=out_path,
+        return_handles=True,
+    )
+
+    assert all(ax.images[0].get_rasterized() for ax in axes.ravel())
+    assert out_path.read_bytes().startswith(b"%PDF")
+    fig.clf()
+
+
 def test_plot_layer_maps_compact_returns_subplot_handles(tmp_path: Path):
     layers, lats, lons, coastline = _sample_inputs()
     out_path = tmp_path / "layers_handles.png"
@@ -71,11 +99,58 @@ def test_plot_layer_maps_compact_returns_subplot_handles(tmp_path: Path):
     assert axes[1, 0].get_xlabel() == "Longitude"
     assert axes[0, 1].get_ylabel() == ""
     assert axes[1, 1].get_ylabel() == ""
+    # Saving parks the layout engine only while writing the file.
+    assert isinstance(fig.get_layout_engine(), ConstrainedLayoutEngine)
+    np.testing.assert_allclose(
+        [ax.get_position().height for ax in axes.ravel()], axes[0, 0].get_position().height
+    )
 
     fig.canvas.draw()
     fig.clf()
 
 
+def test_plot_layer_maps_compact_draws_figure_twice_when_saving(tmp_path: Path, monkeypatch):
+    layers, lats, lons, coastline = _sample_inputs()
+    draws = []
+    original_draw = Figure.draw
+
+    def counting_draw(self, renderer):
+        draws.append(renderer)
+        return original_draw(self, renderer)
+
+    monkeypatch.setattr(Figure, "draw", counting_draw)
+    fig, _axes, _cbar_axes = plot_layer_maps_compact(
+        layers=layers,
+        lats=lats,
+        lons=lons,
+        coastline=coastline,
+        out_path=tmp_path / "layers.png",
+        return_handles=True,
+    )
+
+    # One draw resolves the layout and crop, one renders the file.
+    assert len(draws) == 2
+    assert isinstance(fig.get_layout_engine(), ConstrainedLayoutEngine)
+    fig.clf()
+
+
+def test_plot_single_layer_map_limits_view_to_grid():
+    layers, lats, lons, coastline = _sample_inputs()
+
+    fig, ax = plot_single_layer_map(
+        layers=layers,
+        layer_key="lag_mean",
+        lats=lats,
+        lons=lons,
+        coastline=coastline,
+        return_handles=True,
+    )
+
+    np.testing.assert_allclose(ax.get_xlim(), (lons.min(), lons.max()))
+    np.testing.assert_allclose(ax.get_ylim(), (lats.min(), lats.max()))
+    fig.clf()
+
+
 def test_plot_correlation_maps_by_lag_saves_png(tmp_path: Path):
     lag_maps, lats, lons, coastline = _sample_lag_inputs()
     out_path = tmp_path / "lag_maps.png"
@@ -91,3 +166,153 @@ def test_plot_correlation_maps_by_lag_saves_png(tmp_path: Path):
     assert ret == out_path
     assert out_path.exists()
     assert out_path.stat().st_size > 0
+
+
+def test_plot_layer_maps_compact_uses_image_for_regular_grid():
+    layers, lats, lons, coastline = _sample_inputs()
+
+    fig, axes, _cbar_axes = plot_layer_maps_compact(
+        layers=layers,
+        lats=lats[::-1],
+        lons=lons,
+        coastline=coastline,
+        return_handles=True,
+    )
+
+    image = axes[0, 0].images[0]
+    assert isinstance(image, AxesImage)
+    assert image.get_array().dtype == np.float32
+    # Descending latitudes are flipped so the first row is drawn at the bottom.
+    np.testing.assert_allclose(image.get_array()[0], layers["corr_mean"][-1])
+    np.testing.assert_allclose(image.get_extent(), [-170 - 100 / 14, -70 + 100 / 14, -24.0, 24.0])
+    fig.clf()
+
+
+def test_plot_layer_maps_compact_falls_back_to_mesh_for_irregular_grid():
+    layers, lats, lons, coastline = _sample_inputs()
+    lats = np.array([-20.0, -15.0, -5.0, 0.0, 10.0, 20.0])
+
+    fig, axes, _cbar_axes = plot_layer_maps_compact(
+        layers=layers,
+        lats=lats,
+        lons=lons,
+        coastline=coastline,
+        return_handles=True,
+    )
+
+    assert not axes[0, 0].images
+    meshes = [artist for artist in axes[0, 0].collections if isinstance(artist, QuadMesh)]
+    assert meshes and meshes[0].get_rasterized()
+    # Cell edges sit halfway between the irregular latitude centers.
+    np.testing.assert_allclose(meshes[0].get_coordinates()[:, 0, 1], [-22.5, -17.5, -10, -2.5, 5, 15, 25])
+    fig.clf()
+
+
+def test_coastline_segments_flattens_lines_and_polygon_rings():
+    square = [(0, 0), (1, 0), (1, 1), (0, 1)]
+    hole = [(0.25, 0.25), (0.75, 0.25), (0.75, 0.75)]
+    coastline = gpd.GeoDataFrame(
+        geometry=[
+            LineString([(0, 0), (1, 1)]),
+            MultiLineString([[(0, 0), (1, 0)], [(2, 2), (3, 3), (4, 4)]]),
+            Polygon(square, [hole]),
+        ],
+        crs="EPSG:4326",
+    )
+
+    segments = _coastline_segments(coastline)
+
+    assert [len(segment) for segment in segments] == [2, 2, 3, 5, 4]
+    assert all(segment.shape[1] == 2 for segment in segments)
+
+
+def test_coastline_segments_skips_missing_and_empty_geometries():
+    coastline = gpd.GeoDataFrame(geometry=[None, LineString(), LineString([(0, 0), (1, 1)])], crs="EPSG:4326")
+
+    segments = _coastline_segments(coastline)
+
+    assert len(segments) == 1
+    np.testing.assert_allclose(segments[0], [[0, 0], [1, 1]])
+    assert _coastline_segments(coastline.iloc[:2]) == []
+
+
+def test_plot_correlation_maps_by_lag_draws_shared_coastline():
+    lag_maps, lats, lons, coastline = _sample_lag_inputs()
+
+    fig, axes = plot_correlation_maps_by_lag(
+        lag_maps=lag_maps,
+        lats=lats,
+        lons=lons,
+        coastline=coastline,
+        return_handles=True,
+    )
+
+    drawn = list(axes.ravel()[: len(lag_maps["lags"])])
+    assert all(any(isinstance(artist, LineCollection) for artist in ax.collections) for ax in drawn)
+    fig.clf()
+
+
+def test_coastline_segments_drops_geometry_outside_bbox():
+    coastline = gpd.GeoDataFrame(
+        geometry=[LineString([(-170, -20), (-70, 20)]), LineString([(10, 50), (20, 60)])],
+        crs="EPSG:4326",
+    )
+
+    segments = _coastline_segments(coastline, (-170.0, -70.0, -20.0, 20.0))
+
+    assert len(segments) == 1
+    np.testing.assert_allclose(segments[0], [[-170, -20], [-70, 20]])
+
+
+def test_plot_layer_maps_compact_parallel_composites_tiles(tmp_path: Path):
+    layers, lats, lons, coastline = _sample_inputs()
+    out_path = tmp_path / "layers_parallel.png"
+
+    fig, axes, cbar_axes = plot_layer_maps_compact(
+        layers=layers,
+        lats=lats,
+        lons=lons,
+        coastline=coastline,
+        out_path=out_path,
+        return_handles=True,
+        parallel=True,
+    )
+
+    assert out_path.stat().st_size > 0
+    assert all(ax.images[0].get_array().shape[-1] == 4 for ax in axes.ravel())
+    assert len(cbar_axes) == 4
+    # The autoscaled colorbar matches the data range, as in the serial path.
+    np.testing.assert_allclose(
+        cbar_axes[1].get_ylim(),
+        (layers["driver_rel_time_mean"].min(), layers["driver_rel_time_mean"].max()),
+        rtol=1e-6,
+    )
+    fig.clf()
+
+
+def test_update_layer_maps_compact_reuses_artists(tmp_path: Path):
+    layers, lats, lons, coastline = _sample_inputs()
+    fig, axes, cbar_axes = plot_layer_maps_compact(
+        layers=layers,
+        lats=lats,
+        lons=lons,
+        coastline=coastline,
+        return_handles=True,
+    )
+    images = [ax.images[0] for ax in axes.ravel()]
+
+    updated = {key: values * 2.0 for key, values in layers.items()}
+    updated["corr_mean"] = -layers["corr_mean"]
+    out_path = tmp_path / "updated.png"
+    ret = update_layer_maps_compact(fig, axes, updated, lats, lons, out_path=out_path)
+
+    assert ret == out_path
+    assert out_path.stat().st_size > 0
+    assert [ax.images[0] for ax in axes.ravel()] == images
+    np.testing.assert_allclose(images[0].get_array(), -layers["corr_mean"], rtol=1e-6)
+    np.testing.assert_allclose(
+        cbar_axes[2].get_ylim(),
+        (updated["lag_mean"].min(), updated["lag_mean"].max()),
+        rtol=1e-6,
+    )
+    fig.clf()